@@ -0,0 +1,85 @@
+"""
+Measure the memory held per Entity, both on the Python heap and in the pixel buffers of the Surfaces the Entity references.
+
+Run from the repository root with: `python -m src.bench.memory [entity_count]`
+
+The Entities are constructed as the Game constructs them. Pixel buffers are allocated by SDL rather than through Python, so they're counted separately, from the Surfaces each Entity references. A Surface shared by many Entities, such as a cached image or the TextureAtlas, is counted once and spread over every Entity.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tracemalloc
+from typing import Callable, Iterator
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from pygame import Surface, Vector2
+
+from src.ecs.ecs import Entity
+from src.world.crate_wall import CrateWall
+from src.world.plane import Plane
+
+
+def referenced_surfaces(entity: Entity) -> Iterator[Surface]:
+    """
+    Yield the Surfaces held by the attributes of the Entity, or, for subsurfaces, the Surfaces that own their pixels.
+    :param entity:
+    """
+    names: set[str] = {name for cls in type(entity).__mro__ for name in getattr(cls, "__slots__", ())}
+    names.update(getattr(entity, "__dict__", {}))
+    for name in names:
+        value = getattr(entity, name, None)
+        if isinstance(value, Surface):
+            while value.get_parent() is not None:
+                value = value.get_parent()
+            yield value
+
+
+def measure(constructor: Callable[[int], Entity], entity_count: int) -> tuple[float, float]:
+    """
+    Return the mean number of bytes of Python heap memory, and of Surface pixel buffers, held by each of `entity_count` Entities built by `constructor`.
+    :param constructor: Builds an Entity from its index.
+    :param entity_count:
+    :return:
+    """
+    # Construct one Entity beforehand so that one-time allocations, such as cached images, aren't counted on the Python heap.
+    constructor(0)
+
+    tracemalloc.start()
+    baseline, _ = tracemalloc.get_traced_memory()
+    entities = [constructor(index) for index in range(entity_count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    surfaces: dict[int, Surface] = {id(surface): surface for entity in entities for surface in referenced_surfaces(entity)}
+    pixel_bytes: int = sum(surface.get_pitch() * surface.get_height() for surface in surfaces.values())
+
+    del entities
+    return (current - baseline) / entity_count, pixel_bytes / entity_count
+
+
+def main() -> None:
+    entity_count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    constructors: dict[str, Callable[[int], Entity]] = dict(
+        Plane=lambda index: Plane(
+            position=Vector2(0, 0),
+            rotation=0,
+            render_height=0,
+            linear_velocity=Vector2(10, 0),
+            angular_velocity=0
+        ),
+        CrateWall=lambda index: CrateWall(
+            position=1280 * index,
+            render_height=1,
+            metal_frame_location=index % 5 + 1
+        )
+    )
+    for name, constructor in constructors.items():
+        heap_bytes, pixel_bytes = measure(constructor, entity_count)
+        print(f"{name}: {heap_bytes:.0f} bytes of Python heap + {pixel_bytes:.0f} bytes of pixels = {heap_bytes + pixel_bytes:.0f} bytes per entity")
+
+
+if __name__ == "__main__":
+    main()
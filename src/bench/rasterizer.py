@@ -0,0 +1,71 @@
+"""
+Measure how far the frames of a Rasterizer stray from those of `Game.render`, for planes at random rotations and positions.
+
+Run from the repository root with: `python -m src.bench.rasterizer [sample_count] [rotation_step]`, where a `rotation_step` of `None` measures the exact Rasterizer.
+
+The rotations and positions are drawn from a fixed seed, so every run with the same arguments measures the same frames.
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import numpy as np
+import pygame as pg
+from pygame import Surface, Vector2
+
+from src.render.rasterizer import Rasterizer
+from src.scene.game import Game
+
+
+def measure(rotation_step: float | None, sample_count: int, seed: int = 0) -> dict[str, float]:
+    """
+    Render a Game with a plane at each of `sample_count` random rotations and positions, with both `Game.render` and a Rasterizer, and compare the frames.
+    :param rotation_step: As for `Rasterizer`.
+    :param sample_count:
+    :param seed:
+    :return: The greatest and mean number of differing pixels per frame, and the greatest difference of any color channel.
+    """
+    pg.font.init()
+    game = Game(seed=seed)
+    rasterizer = Rasterizer(rotation_step)
+    screen = Surface(game.window_size)
+    frame: np.ndarray = np.empty((3, int(game.window_size.y), int(game.window_size.x)), dtype=np.uint8)
+    rng = np.random.default_rng(seed)
+
+    differing_pixels: list[int] = []
+    max_channel_difference: int = 0
+    for _ in range(sample_count):
+        game.plane.rotation = float(rng.uniform(-180, 180))
+        game.plane.position = Vector2(float(rng.uniform(0, 50)), float(rng.uniform(-300, 300)))
+        game.render(screen)
+        expected: np.ndarray = np.transpose(pg.surfarray.pixels3d(screen), axes=(2, 1, 0)).astype(np.int16)
+        rasterizer.render_game(game, frame)
+        difference: np.ndarray = np.abs(frame - expected)
+        differing_pixels.append(int(difference.any(axis=0).sum()))
+        max_channel_difference = max(max_channel_difference, int(difference.max()))
+
+    return dict(
+        max_differing_pixels=max(differing_pixels),
+        mean_differing_pixels=float(np.mean(differing_pixels)),
+        max_channel_difference=max_channel_difference
+    )
+
+
+def main() -> None:
+    sample_count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    rotation_step: float | None = 0.5
+    if len(sys.argv) > 2:
+        rotation_step = None if sys.argv[2] == "None" else float(sys.argv[2])
+    result: dict[str, float] = measure(rotation_step, sample_count)
+    print(
+        f"rotation_step={rotation_step}, {sample_count} frames: at most {result['max_differing_pixels']} differing pixels per frame "
+        f"(mean {result['mean_differing_pixels']:.1f}), and a greatest channel difference of {result['max_channel_difference']}"
+    )
+
+
+if __name__ == "__main__":
+    main()
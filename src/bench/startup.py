@@ -0,0 +1,83 @@
+"""
+Measure the cold start time of a FlightSchool and of the game's Splash, each in a new Python process.
+
+Run from the repository root with: `python -m src.bench.startup [run_count]`
+
+Each measurement is split into importing the module, constructing the FlightSchool or Splash, and the first reset and step, and the median of `run_count` runs is reported.
+The import time includes PyGame, NumPy and Gymnasium, which dominate it.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+# Each script prints a JSON object of the seconds taken by each phase.
+_FLIGHT_SCHOOL_SCRIPT: str = """
+import json, time
+start = time.perf_counter()
+from src.gym.flight_school import FlightSchool
+imported = time.perf_counter()
+env = FlightSchool(None, {obs_type!r})
+constructed = time.perf_counter()
+env.reset(seed=0)
+env.step(0)
+stepped = time.perf_counter()
+print(json.dumps(dict(imported=imported - start, constructed=constructed - imported, stepped=stepped - constructed)))
+"""
+
+_SPLASH_SCRIPT: str = """
+import json, time
+start = time.perf_counter()
+import pygame as pg
+from src.scene.splash import Splash
+imported = time.perf_counter()
+pg.display.init()
+pg.font.init()
+pg.display.set_mode(size=(1280, 720))
+Splash()
+constructed = time.perf_counter()
+print(json.dumps(dict(imported=imported - start, constructed=constructed - imported, stepped=0.0)))
+"""
+
+
+def measure(script: str, run_count: int, environment: dict[str, str] | None = None) -> dict[str, float]:
+    """
+    Return the median number of seconds taken by each phase of `script` over `run_count` runs, each in a new Python process.
+    :param script:
+    :param run_count:
+    :param environment: Environment variables to set for the new processes.
+    :return:
+    """
+    runs: list[dict[str, float]] = []
+    for _ in range(run_count):
+        output: str = subprocess.run(
+            [sys.executable, "-c", script],
+            env={**os.environ, "PYGAME_HIDE_SUPPORT_PROMPT": "1", **(environment or {})},
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        runs.append(json.loads(output.splitlines()[-1]))
+    return {phase: statistics.median(run[phase] for run in runs) for phase in runs[0]}
+
+
+def main() -> None:
+    run_count: int = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    measurements: dict[str, dict[str, float]] = {
+        f"FlightSchool({obs_type})": measure(_FLIGHT_SCHOOL_SCRIPT.format(obs_type=obs_type), run_count)
+        for obs_type in ("numeric", "rays", "rgb_array")
+    }
+    measurements["Splash"] = measure(_SPLASH_SCRIPT, run_count, dict(SDL_VIDEODRIVER=os.environ.get("SDL_VIDEODRIVER", "dummy")))
+
+    print(f"{'':<24}{'import':>10}{'construct':>12}{'first step':>12}{'total':>10}")
+    for name, phases in measurements.items():
+        print(f"{name:<24}" + "".join(f"{phases[phase] * 1000:>{width}.1f}" for phase, width in (("imported", 10), ("constructed", 12), ("stepped", 12))) + f"{sum(phases.values()) * 1000:>10.1f}")
+    print("Times are the median milliseconds of each phase.")
+
+
+if __name__ == "__main__":
+    main()
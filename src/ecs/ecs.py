@@ -1,31 +1,120 @@
 from __future__ import annotations
 
-from abc import ABC, abstractmethod
+from abc import ABCMeta, abstractmethod
 from inspect import Parameter, signature
 from itertools import combinations, permutations
+from time import perf_counter
 from typing import Any, Callable, Iterable
 
 
-class Entity(ABC):
+class SlottedLayout(ABCMeta):
+    """
+    The metaclass of Entities and Components, which lays out Entity instances with `__slots__` rather than a per-instance `__dict__`.
+    A class may only inherit non-empty `__slots__` from one of its bases, and an Entity inherits from many Components. So, instead of declaring `__slots__`, each Component lists the attributes that it sets in `_fields` and is given empty `__slots__`. Each Entity class is then given a slot for every field of its bases (and of itself) that isn't already slotted.
+    A class that declares its own `__slots__` is left as is.
+    """
 
-    _next_id: int = 0
+    def __new__(mcs, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs):
+        if "__slots__" not in namespace:
+            holds_fields: bool = namespace.get("_holds_fields", any(getattr(base, "_holds_fields", False) for base in bases))
+            if holds_fields:
+                ancestors: list[type] = [ancestor for base in bases for ancestor in base.__mro__]
+                slotted: set[str] = {slot for ancestor in ancestors for slot in vars(ancestor).get("__slots__", ())}
+                fields: dict[str, None] = dict.fromkeys(
+                    field
+                    for fields_owner in (*(vars(ancestor) for ancestor in ancestors), namespace)
+                    for field in fields_owner.get("_fields", ())
+                )
+                namespace["__slots__"] = tuple(field for field in fields if field not in slotted)
+            else:
+                namespace["__slots__"] = ()
+        return super().__new__(mcs, name, bases, namespace, **kwargs)
+
+
+class Entity(metaclass=SlottedLayout):
+
+    _holds_fields: bool = True
+    _fields: tuple[str, ...] = ("_id",)
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self._id = Entity._next_id
-        Entity._next_id += 1
+        # Assigned by the World that the Entity is added to.
+        self._id: int | None = None
 
     @property
-    def id(self):
+    def id(self) -> int | None:
         return self._id
 
+    def respawn(self, **kwargs) -> None:
+        """
+        Restore the mutable state of a despawned Entity so that it can be recycled by a World instead of constructing a new Entity.
+        Entity types that support recycling override this method, accepting the same keyword arguments as their `__init__`.
+        :param kwargs:
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support being respawned.")
+
+
+class Component(metaclass=SlottedLayout):
+    """
+    The base of the mixin classes that add data to Entity-Type classes.
+    Subclasses list the names of the attributes that they set in `_fields`, so that the Entity classes that they are mixed into can give those attributes slots.
+    """
+
+    _fields: tuple[str, ...] = ()
 
-class Component(ABC):
     @abstractmethod
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
 
+class SystemProfile:
+    """
+    Aggregated timing statistics for a System: the number of calls, the number of Entity tuples the `action` function was applied to, the total wall time, and a histogram of per-call wall times.
+    The histogram has one bucket per power of two microseconds, such that bucket `n` counts the calls that took less than `2 ** n` microseconds (and at least `2 ** (n - 1)`). The last bucket also holds every slower call.
+    """
+
+    __slots__ = ("calls", "tuples", "wall_time", "histogram")
+
+    histogram_size: int = 24
+
+    def __init__(self):
+        self.calls: int = 0
+        self.tuples: int = 0
+        self.wall_time: float = 0.0
+        self.histogram: list[int] = [0] * self.histogram_size
+
+    def record(self, wall_time: float) -> None:
+        """
+        Record a single call to the System that took `wall_time` seconds.
+        :param wall_time:
+        """
+        self.calls += 1
+        self.wall_time += wall_time
+        self.histogram[min(int(wall_time * 1_000_000).bit_length(), self.histogram_size - 1)] += 1
+
+    def reset(self) -> None:
+        """
+        Zero all the recorded statistics.
+        """
+        self.calls = 0
+        self.tuples = 0
+        self.wall_time = 0.0
+        self.histogram = [0] * self.histogram_size
+
+    def as_dict(self) -> dict[str, Any]:
+        return dict(
+            calls=self.calls,
+            tuples=self.tuples,
+            wall_time=self.wall_time,
+            mean_wall_time=self.wall_time / self.calls if self.calls else 0.0,
+            histogram=tuple(self.histogram)
+        )
+
+
+def _accept_all(_: Entity) -> bool:
+    return True
+
+
 class System:
     def __init__(
         self,
@@ -33,20 +122,120 @@ class System:
         # but Python doesn't yet have variadic type hinting for Callable.
         action: Callable,
         is_symmetric: bool = True,
-        predicate: Callable[[Entity], bool] = lambda _: True
+        predicate: Callable[[Entity], bool] = _accept_all,
+        collects_results: bool = True,
+        reads: Iterable[type[Component]] = (),
+        writes: Iterable[type[Component]] = ()
     ):
         """
         A bundle that contains an `action` function that is applied to an Iterable of Entities when called, the specification of whether the `action` function is symmetric, and a predicate to filter out certain Entities before the `action` function is applied.
         :param action: The function that is to be applied to the supplied Entities. Note: all positional arguments (specifically `POSITIONAL_OR_KEYWORD`) should be reserved for Entity parameters. If keyword parameters are to be included, they must be segregated with a `*`. For example: `def my_action(en0, en1, en2, *, my_keyword): ...`
         :param is_symmetric: Should alternate orderings of Entities be treated as identical? In effect, should (a, b, c, d) be treated the same as (d, c, a, b)? Note: when `is_symmetric` is True, each **combination** of Entities will only ever be processed once per System call; whereas when `is_symmetric` is False, each **permutation** of Entities will be processed once per System call.
         :param predicate: A function used to filter Entities before applying the `action` function.
+        :param collects_results: Should the results of the `action` function be returned when the System is called? Systems whose `action` functions are only called for their side effects should pass False so that no tuple of results is built.
+        :param reads: The Component types whose data the System reads. Used by a Scheduler to order Systems.
+        :param writes: The Component types whose data the System modifies. Used by a Scheduler to order Systems.
         """
         self._action: Callable = action
         self._action_domain_size = sum(1 for param in signature(action).parameters.values() if param.kind == Parameter.POSITIONAL_OR_KEYWORD)
         self._is_symmetric: bool = is_symmetric
         self._predicate: Callable[[Entity], bool] = predicate
+        self._collects_results: bool = collects_results
+        self.reads: frozenset[type[Component]] = frozenset(reads)
+        self.writes: frozenset[type[Component]] = frozenset(writes)
+        self.profile: SystemProfile | None = None
+
+        # Select the dispatch loop once, rather than building the same pipeline on every call.
+        # Unary actions don't need combinations or permutations, as each Entity is its own 1-tuple.
+        if self._action_domain_size == 1:
+            self._dispatch: Callable[[Iterable[Entity], dict[str, Any]], Any] = self._dispatch_unary_collect if collects_results else self._dispatch_unary_discard
+        else:
+            self._dispatch = self._dispatch_product_collect if collects_results else self._dispatch_product_discard
+
+    def conflicts_with(self, other: System) -> bool:
+        """
+        Return whether this System and the `other` System must not run concurrently, which is the case when either one writes a Component type that the other reads or writes.
+        Component types are compared by inheritance, so writing a Transform conflicts with reading a Velocity, and vice versa.
+        """
+        def overlap(component_types_0: frozenset[type[Component]], component_types_1: frozenset[type[Component]]) -> bool:
+            return any(issubclass(ct0, ct1) or issubclass(ct1, ct0) for ct0 in component_types_0 for ct1 in component_types_1)
+
+        return overlap(self.writes, other.reads | other.writes) or overlap(other.writes, self.reads)
+
+    def enable_profiling(self) -> SystemProfile:
+        """
+        Begin recording the calls made to this System. Profiling is disabled by default, in which case it costs a single attribute check per call.
+        :return: The SystemProfile into which the calls are recorded.
+        """
+        if self.profile is None:
+            self.profile = SystemProfile()
+        return self.profile
+
+    def disable_profiling(self) -> None:
+        self.profile = None
+
+    def __call__(self, entities: Iterable[Entity], **kwargs) -> Any:
+        if self.profile is None:
+            return self.run(entities, **kwargs)
 
-    def __call__(self, entities: Iterable[Entity], **kwargs) -> tuple[Any, ...]:
+        start_time = perf_counter()
+        result = self.run(entities, **kwargs)
+        self.profile.record(perf_counter() - start_time)
+        return result
+
+    def run(self, entities: Iterable[Entity], **kwargs) -> Any:
+        """
+        Apply the `action` function to each of the tuples of the supplied Entities that satisfy the predicate.
+        Subclasses that do work beyond applying the `action` function should override this method, rather than `__call__`, so that the work is included in their SystemProfile.
+        :param entities:
+        :param kwargs: Keyword arguments passed along to the `action` function.
+        :return: The results of the `action` function for each tuple of Entities, or None if the System doesn't collect results.
+        """
+        if not self._collects_results:
+            tuple_count = self._dispatch(entities, kwargs)
+            if self.profile is not None:
+                self.profile.tuples += tuple_count
+            return None
+
+        results = self._dispatch(entities, kwargs)
+        if self.profile is not None:
+            self.profile.tuples += len(results)
+        return results
+
+    def _filter(self, entities: Iterable[Entity]) -> Iterable[Entity]:
+        return entities if self._predicate is _accept_all else filter(self._predicate, entities)
+
+    def _product(self, entities: Iterable[Entity]) -> Iterable[tuple[Entity, ...]]:
         product_type = combinations if self._is_symmetric else permutations
-        product = product_type(filter(self._predicate, entities), self._action_domain_size)
-        return tuple(self._action(*entity_tuple, **kwargs) for entity_tuple in product)
+        return product_type(self._filter(entities), self._action_domain_size)
+
+    def _dispatch_unary_collect(self, entities: Iterable[Entity], kwargs: dict[str, Any]) -> tuple[Any, ...]:
+        action = self._action
+        if kwargs:
+            return tuple(action(entity, **kwargs) for entity in self._filter(entities))
+        return tuple(map(action, self._filter(entities)))
+
+    def _dispatch_unary_discard(self, entities: Iterable[Entity], kwargs: dict[str, Any]) -> int:
+        action = self._action
+        tuple_count = 0
+        if kwargs:
+            for entity in self._filter(entities):
+                action(entity, **kwargs)
+                tuple_count += 1
+        else:
+            for entity in self._filter(entities):
+                action(entity)
+                tuple_count += 1
+        return tuple_count
+
+    def _dispatch_product_collect(self, entities: Iterable[Entity], kwargs: dict[str, Any]) -> tuple[Any, ...]:
+        action = self._action
+        return tuple(action(*entity_tuple, **kwargs) for entity_tuple in self._product(entities))
+
+    def _dispatch_product_discard(self, entities: Iterable[Entity], kwargs: dict[str, Any]) -> int:
+        action = self._action
+        tuple_count = 0
+        for entity_tuple in self._product(entities):
+            action(*entity_tuple, **kwargs)
+            tuple_count += 1
+        return tuple_count
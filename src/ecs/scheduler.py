@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from concurrent.futures import Executor
+from typing import Any, Iterable
+
+from src.ecs.ecs import Entity, System
+
+
+class Scheduler:
+    def __init__(self, *systems: System, executor: Executor | None = None):
+        """
+        A pipeline of Systems that are run, in stages, over a single shared query of Entities.
+        The stages are built once, from the `reads` and `writes` declared by each System: a System is placed in the stage after the last stage holding an earlier System that it conflicts with. Systems within a stage never conflict with one another, so they may run concurrently.
+        :param systems: The Systems, in the order that their effects are intended to be applied.
+        :param executor: An optional Executor (for example, a ThreadPoolExecutor) used to run the Systems of each stage concurrently. This is only beneficial when the Systems spend their time in code that releases the GIL, such as PyGame blits and NumPy operations.
+        """
+        self.systems: tuple[System, ...] = systems
+        self.executor: Executor | None = executor
+
+        stage_indices: list[int] = []
+        for index, system in enumerate(systems):
+            stage_indices.append(
+                max(
+                    (stage_indices[earlier_index] + 1 for earlier_index in range(index) if system.conflicts_with(systems[earlier_index])),
+                    default=0
+                )
+            )
+
+        self.stages: tuple[tuple[System, ...], ...] = tuple(
+            tuple(system for system, stage_index in zip(systems, stage_indices) if stage_index == stage)
+            for stage in range(max(stage_indices, default=-1) + 1)
+        )
+
+    def __call__(self, entities: Iterable[Entity], **kwargs) -> dict[System, Any]:
+        """
+        Run each stage of Systems over the supplied Entities.
+        The Entities are gathered once and shared by every System, so the supplied Iterable may be a single-use World query.
+        :param entities:
+        :param kwargs: Keyword arguments passed along to every System.
+        :return: The results of each System, keyed by the System.
+        """
+        entities = tuple(entities)
+        results: dict[System, Any] = {}
+
+        for stage in self.stages:
+            if self.executor is None or len(stage) == 1:
+                for system in stage:
+                    results[system] = system(entities, **kwargs)
+            else:
+                futures = [(system, self.executor.submit(system, entities, **kwargs)) for system in stage]
+                for system, future in futures:
+                    results[system] = future.result()
+
+        return results
@@ -1,16 +1,60 @@
 from __future__ import annotations
 
-from typing import Generator
+from array import array
+from math import cos, radians, sin
+from typing import Generator, Iterable
 
 from pygame import Vector2
 
 
 class Polygon:
-    def __init__(self, *vertices: Vector2):
-        self.vertices: tuple[Vector2, ...] = vertices
+    """
+    A polygon whose vertices are stored as a flat array of interleaved x and y coordinates, rather than as a tuple of Vector2s.
+    """
+
+    __slots__ = ("coordinates",)
+
+    def __init__(self, *vertices: Vector2 | tuple[float, float]):
+        self.coordinates: array = array("d", (coordinate for vertex in vertices for coordinate in (vertex[0], vertex[1])))
+
+    @classmethod
+    def from_coordinates(cls, coordinates: Iterable[float]) -> Polygon:
+        """
+        Return a new Polygon from a flat Iterable of interleaved x and y coordinates.
+        :param coordinates:
+        :return:
+        """
+        polygon = cls.__new__(cls)
+        polygon.coordinates = array("d", coordinates)
+        return polygon
+
+    @property
+    def vertices(self) -> tuple[Vector2, ...]:
+        coordinates = self.coordinates
+        return tuple(Vector2(coordinates[n], coordinates[n + 1]) for n in range(0, len(coordinates), 2))
+
+    def set_vertices(self, *vertices: Vector2 | tuple[float, float]) -> None:
+        """
+        Replace, in place, the vertices of the Polygon with the same number of new vertices.
+        :param vertices:
+        :return:
+        """
+        coordinates = self.coordinates
+        for n, vertex in enumerate(vertices):
+            coordinates[2 * n] = vertex[0]
+            coordinates[2 * n + 1] = vertex[1]
+
+    def __len__(self) -> int:
+        return len(self.coordinates) // 2
 
     def __add__(self, other: Vector2) -> Polygon:
-        return Polygon(*(vertex + other for vertex in self.vertices))
+        other_x, other_y = other
+        coordinates = self.coordinates
+        return Polygon.from_coordinates(
+            coordinate
+            for n in range(0, len(coordinates), 2)
+            for coordinate in (coordinates[n] + other_x, coordinates[n + 1] + other_y)
+        )
 
     def __sub__(self, other):
         return self.__add__(-other)
@@ -21,11 +65,83 @@ class Polygon:
         :param degrees:
         :return:
         """
-        return Polygon(*(vertex.rotate(degrees) for vertex in self.vertices))
+        if degrees % 360 == 0:
+            return Polygon.from_coordinates(self.coordinates)
+
+        cosine = cos(radians(degrees))
+        sine = sin(radians(degrees))
+        coordinates = self.coordinates
+        return Polygon.from_coordinates(
+            coordinate
+            for n in range(0, len(coordinates), 2)
+            for coordinate in (
+                coordinates[n] * cosine - coordinates[n + 1] * sine,
+                coordinates[n] * sine + coordinates[n + 1] * cosine
+            )
+        )
+
+    def sweep_to(self, other: Polygon) -> Polygon:
+        """
+        Return the convex hull of the vertices of this Polygon and the `other` Polygon.
+        When `other` is a translated copy of this convex Polygon, the hull is exactly the region swept by moving this Polygon to `other` in a straight line.
+        :param other:
+        :return:
+        """
+        points = sorted(set(zip(self.coordinates[0::2], self.coordinates[1::2])) | set(zip(other.coordinates[0::2], other.coordinates[1::2])))
+        if len(points) <= 2:
+            return Polygon(*points)
+
+        def cross(o: tuple[float, float], a: tuple[float, float], b: tuple[float, float]) -> float:
+            return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+        # Andrew's monotone chain
+        lower: list[tuple[float, float]] = []
+        for point in points:
+            while len(lower) >= 2 and cross(lower[-2], lower[-1], point) <= 0:
+                lower.pop()
+            lower.append(point)
+        upper: list[tuple[float, float]] = []
+        for point in reversed(points):
+            while len(upper) >= 2 and cross(upper[-2], upper[-1], point) <= 0:
+                upper.pop()
+            upper.append(point)
+
+        return Polygon(*(lower[:-1] + upper[:-1]))
+
+    def bounds(self) -> tuple[float, float, float, float]:
+        """
+        Return the minimum x, minimum y, maximum x, and maximum y of the vertices of the Polygon.
+        :return:
+        """
+        xs = self.coordinates[0::2]
+        ys = self.coordinates[1::2]
+        return min(xs), min(ys), max(xs), max(ys)
 
     def surface_normals(self) -> Generator[Vector2, None, None]:
         """
         Return a Generator of the non-normalized Vectors that sit perpendicular to each surface of the Polygon.
         :return:
         """
-        return ((b - a).rotate(90) for a, b in zip(self.vertices, self.vertices[1:] + (self.vertices[0],)))
+        return (Vector2(-edge_y, edge_x) for edge_x, edge_y in self.edges())
+
+    def projection_bounds(self, axis_x: float, axis_y: float) -> tuple[float, float]:
+        """
+        Return the minimum and maximum of the dot products of each vertex with the supplied axis.
+        :param axis_x:
+        :param axis_y:
+        :return:
+        """
+        coordinates = self.coordinates
+        projections = [coordinates[n] * axis_x + coordinates[n + 1] * axis_y for n in range(0, len(coordinates), 2)]
+        return min(projections), max(projections)
+
+    def edges(self) -> Generator[tuple[float, float], None, None]:
+        """
+        Return a Generator of the (x, y) displacements from each vertex of the Polygon to the next.
+        :return:
+        """
+        coordinates = self.coordinates
+        vertex_count = len(coordinates) // 2
+        for n in range(vertex_count):
+            m = (n + 1) % vertex_count
+            yield coordinates[2 * m] - coordinates[2 * n], coordinates[2 * m + 1] - coordinates[2 * n + 1]
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import numpy as np
+
+
+def cast_rays(
+    origin: tuple[float, float],
+    directions: np.ndarray,
+    rectangles: np.ndarray,
+    horizontal_lines: tuple[float, ...],
+    max_distance: float
+) -> np.ndarray:
+    """
+    Return the distance along each ray to the nearest of the supplied axis-aligned rectangles and horizontal lines, computed analytically for every ray at once.
+    :param origin: The (x, y) point from which every ray is cast.
+    :param directions: An array shaped (ray count, 2) of the unit (x, y) direction of each ray.
+    :param rectangles: An array shaped (rectangle count, 4) of the minimum x, minimum y, maximum x, and maximum y of each rectangle.
+    :param horizontal_lines: The y coordinates of lines, such as a floor and ceiling, that span every x.
+    :param max_distance: The distance reported for rays that hit nothing, and the furthest distance that any ray reports.
+    :return: A float32 array shaped (ray count,) of distances. A ray cast from inside a rectangle has a distance of 0.
+    """
+    origin_x, origin_y = origin
+    direction_x = directions[:, 0:1]
+    direction_y = directions[:, 1:2]
+    distances = np.full(len(directions), max_distance, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        inverse_x = 1.0 / direction_x
+        inverse_y = 1.0 / direction_y
+
+        for line_y in horizontal_lines:
+            line_distances = (line_y - origin_y) * inverse_y[:, 0]
+            np.fmin(distances, np.where(line_distances >= 0, line_distances, np.inf), out=distances)
+
+        if len(rectangles):
+            # Slab method: the ray is inside the rectangle between entering both of its slabs and leaving either.
+            x_0 = (rectangles[:, 0] - origin_x) * inverse_x
+            x_1 = (rectangles[:, 2] - origin_x) * inverse_x
+            y_0 = (rectangles[:, 1] - origin_y) * inverse_y
+            y_1 = (rectangles[:, 3] - origin_y) * inverse_y
+
+            # A ray parallel to a slab yields NaN when it starts on the slab's boundary; fmin and fmax ignore it.
+            entry = np.fmax(np.fmin(x_0, x_1), np.fmin(y_0, y_1))
+            exit_ = np.fmin(np.fmax(x_0, x_1), np.fmax(y_0, y_1))
+            entry = np.maximum(entry, 0)
+
+            rectangle_distances = np.where(exit_ >= entry, entry, np.inf)
+            np.fmin(distances, rectangle_distances.min(axis=1), out=distances)
+
+    return np.minimum(distances, max_distance).astype(np.float32)
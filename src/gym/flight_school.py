@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import Any, Callable
+import os
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable
 
 import gymnasium as gym
 import numpy as np
@@ -12,41 +14,87 @@ from pygame.event import Event
 
 from src.event.event_handler import EventHandler
 from src.scene.game import Game
+from src.world.course_table import CourseTable
 from src.world.crate_wall import CrateWall
 
+if TYPE_CHECKING:
+    from src.gym.telemetry import Telemetry
+    from src.render.presenter import Presenter
+
 # :param is_pitching_up: A boolean
+# :param plane_index: Optionally, the index of the plane to control, which defaults to 0
 # Example: Event(PLANE_CONTROL_EVENT, is_pitching_up=True)
 PLANE_CONTROL_EVENT: int = pg.USEREVENT
 
 
 class AgentEventHandler(EventHandler):
-    def __init__(self, set_plane_is_pitching_up: Callable[[bool], None], **kwargs):
+    def __init__(self, set_plane_is_pitching_up: Callable[[bool, int], None], **kwargs):
         super().__init__(**kwargs)
-        self.set_plane_is_pitching_up: Callable[[bool], None] = set_plane_is_pitching_up
+        self.set_plane_is_pitching_up: Callable[[bool, int], None] = set_plane_is_pitching_up
 
     def __call__(self, event: Event):
         if event.type == PLANE_CONTROL_EVENT:
+            plane_index: int = getattr(event, "plane_index", 0)
             if event.is_pitching_up:
-                return self.set_plane_is_pitching_up(True)
+                return self.set_plane_is_pitching_up(True, plane_index)
             else:
-                return self.set_plane_is_pitching_up(False)
+                return self.set_plane_is_pitching_up(False, plane_index)
 
 
 class FlightSchool(gym.Env):
     metadata = {
         "render_modes": ["human", None],
         "render_fps":   60,
-        "obs_types":    ["numeric", "rgb_array"]
+        "obs_types":    ["numeric", "rgb_array", "rays"]
     }
 
-    _crate_walls_per_obs: int = 2
-
-    def __init__(self, render_mode, obs_type):
+    _plane_count: int = 1
+
+    def __init__(
+        self,
+        render_mode,
+        obs_type,
+        profile_systems: bool = False,
+        crate_walls_per_obs: int = 2,
+        course_table: CourseTable | str | os.PathLike | None = None,
+        ray_count: int = 16,
+        ray_field_of_view: float = 180.0,
+        ray_max_distance: float = 1280.0,
+        frame_skip: int = 1,
+        max_pool_frames: bool = False,
+        present_in_thread: bool = False,
+        telemetry: Telemetry | None = None
+    ):
+        """
+        :param render_mode: One of `metadata["render_modes"]`.
+        :param obs_type: One of `metadata["obs_types"]`.
+        :param profile_systems: Should the statistics of each of the Game's Systems be recorded and reported in the info dict?
+        :param crate_walls_per_obs: The number of upcoming CrateWalls included in numeric observations.
+        :param course_table: A course to fly in every episode, or the path of a course saved by `CourseTable.save`, which is memory-mapped so that it's shared with every other FlightSchool that opens it. If None, each episode flies a new course seeded by `reset`.
+        :param ray_count: The number of rays in rays observations.
+        :param ray_field_of_view: The angle, in degrees, of the fan of rays, which is centered on the heading of the plane.
+        :param ray_max_distance: The distance reported by rays that hit nothing within it.
+        :param frame_skip: The number of Game steps for which each action is repeated. The rewards of the Game steps are summed, the repetition stops early if the episode terminates, and an observation is only built after the last Game step.
+        :param max_pool_frames: For rgb_array observations with a `frame_skip` above 1, should the observation be the elementwise maximum of the frames of the last two Game steps? If the episode terminates before the second to last Game step, only the last frame is observed.
+        :param present_in_thread: For the human render mode, should frames be presented to the window by a Presenter's thread, such that stepping never waits on the window being updated?
+        :param telemetry: Where the steps, episodes, scores, reset latencies, and collision checks are counted, to be written periodically to its sink. It's flushed when the FlightSchool is closed.
+        """
 
         self.render_mode = render_mode
         self.obs_type = obs_type
+        self.profile_systems: bool = profile_systems
+        self._crate_walls_per_obs: int = crate_walls_per_obs
+        self.course_table: CourseTable | None = CourseTable.open(course_table) if isinstance(course_table, (str, os.PathLike)) else course_table
+        assert frame_skip >= 1, "Each action must be applied for at least one Game step."
+        self.frame_skip: int = frame_skip
+        self.max_pool_frames: bool = max_pool_frames and obs_type == "rgb_array" and frame_skip > 1
+        self.telemetry: Telemetry | None = telemetry
+        self._episode_steps: int = 0
         self.action_space = spaces.MultiBinary(1)
 
+        self._ray_angles: np.ndarray = np.linspace(-ray_field_of_view / 2, ray_field_of_view / 2, ray_count)
+        self._ray_max_distance: float = ray_max_distance
+
         if obs_type == "numeric":
             self._get_obs = self._get_numeric_obs
             self.observation_space = \
@@ -76,7 +124,7 @@ class FlightSchool(gym.Env):
                     # Defined as a Tuple Space so that the FlattenObservation wrapper can be used.
                     # Note: Flattening Discrete Spaces results in one-hot encoding.
                     # https://gymnasium.farama.org/api/wrappers/observation_wrappers/#gymnasium.wrappers.FlattenObservation
-                    crate_walls=spaces.Tuple((
+                    crate_walls=spaces.Tuple(tuple(
                         spaces.Dict(dict(
                             position=spaces.Box(
                                 low=0,
@@ -86,17 +134,7 @@ class FlightSchool(gym.Env):
                                 n=5,
                                 start=1
                             )
-                        )),
-                        spaces.Dict(dict(
-                            position=spaces.Box(
-                                low=0,
-                                high=np.inf
-                            ),
-                            gap_location=spaces.Discrete(
-                                n=5,
-                                start=1
-                            )
-                        ))
+                        )) for _ in range(self._crate_walls_per_obs)
                     ))
                 ))
         elif obs_type == "rgb_array":
@@ -104,53 +142,81 @@ class FlightSchool(gym.Env):
             self.observation_space = spaces.Box(
                 low=0,
                 high=255,
-                shape=(3, self.game.window_size.y, self.game.window_size.x),
+                shape=(3, int(Game.window_size.y), int(Game.window_size.x)),
                 dtype=np.uint8
             )
 
-        pg.init()
+        elif obs_type == "rays":
+            # Imported on demand, as is the Presenter, so that headless workers import no more than they use.
+            from src.geometry.raycast import cast_rays
+            self._cast_rays: Callable[..., np.ndarray] = cast_rays
+            self._get_obs = self._get_rays_obs
+            self.observation_space = spaces.Box(
+                low=0.0,
+                high=ray_max_distance,
+                shape=(ray_count,),
+                dtype=np.float32
+            )
+
+        # Only the subsystems that are used are initialized, as initializing the others, such as audio, slows the start of every worker.
+        # The Game renders its score with a Font, even when it isn't displayed.
+        pg.font.init()
 
         self.window: Surface | None = None
         if self.render_mode == "human":
+            pg.display.init()
             self.window = pg.display.set_mode(size=Game.window_size)
             self.clock = pg.time.Clock()
 
-        self.game: Game = Game(event_handler=AgentEventHandler)
+        self.presenter: Presenter | None = None
+        if self.window and present_in_thread:
+            # Imported on demand, as is the raycasting of rays observations.
+            import src.render.presenter as presenter
+            self.presenter = presenter.Presenter(self.window)
+
+        self.game: Game = Game(
+            event_handler=AgentEventHandler,
+            plane_count=self._plane_count,
+            profile_systems=self.profile_systems,
+            course_table=self.course_table
+        )
         self.current_score: int = self.game.score
 
-    def _get_obs(self) -> ObsType:
-        raise ValueError("method: _get_obs must be set to _get_numeric_obs or _get_rgb_array_obs during initialization.")
+    def _get_obs(self, pilot_index: int = 0) -> ObsType:
+        raise ValueError("method: _get_obs must be set to _get_numeric_obs, _get_rgb_array_obs, or _get_rays_obs during initialization.")
 
-    def _get_numeric_obs(self) -> ObsType:
+    def _get_numeric_obs(self, pilot_index: int = 0) -> ObsType:
+        pilot = self.game.pilots[pilot_index]
 
         plane_obs: dict[str, dict[str, float]] = dict(
             position=dict(
-                x=self.game.plane.position.x,
-                y=self.game.plane.position.y
+                x=pilot.plane.position.x,
+                y=pilot.plane.position.y
             ),
             velocity=dict(
-                x=self.game.plane.linear_velocity.x,
-                y=self.game.plane.linear_velocity.y
+                x=pilot.plane.linear_velocity.x,
+                y=pilot.plane.linear_velocity.y
             )
         )
 
-        # noinspection PyTypeChecker
-        position_ordered_crate_walls: list[CrateWall] = sorted(
-            self.game.world.query(lambda entity: isinstance(entity, CrateWall)),
-            key=lambda cw: cw.position.x
+        # The pilot's score is the index, within the whole course, of the next CrateWall that the pilot is to pass.
+        # The CrateWalls ahead of a crashed plane may have already been despawned.
+        position_ordered_crate_walls: list[CrateWall] = self.game.course.upcoming(
+            self._crate_walls_per_obs,
+            start=max(pilot.score - self.game.course.first_index, 0)
         )
 
-        # Ensure the number of CrateWalls in the observation equals self._crate_walls_per_obs
-        if len(position_ordered_crate_walls) > self._crate_walls_per_obs:
-            position_ordered_crate_walls = position_ordered_crate_walls[:self._crate_walls_per_obs]
-        elif len(position_ordered_crate_walls) < self._crate_walls_per_obs:
-            position_ordered_crate_walls += ([CrateWall(position=np.inf)] * (self._crate_walls_per_obs - len(position_ordered_crate_walls)))
-
+        # CrateWalls are only spawned a window's width ahead, so the remainder of the observation is read ahead from the course.
         crate_walls_obs: tuple[dict[str, float], ...] = tuple(
             dict(
                 position=cw.position.x,
                 gap_location=cw.metal_frame_location
             ) for cw in position_ordered_crate_walls
+        ) + tuple(
+            dict(
+                position=position,
+                gap_location=metal_frame_location
+            ) for position, metal_frame_location in self.game.unspawned_crate_walls(self._crate_walls_per_obs - len(position_ordered_crate_walls))
         )
 
         return dict(
@@ -158,33 +224,124 @@ class FlightSchool(gym.Env):
             crate_walls=crate_walls_obs
         )
 
-    def _get_rgb_array_obs(self) -> ObsType:
-        obs_surface: Surface = Surface(self.game.window_size)
-        self.game.render(obs_surface)
-        return np.transpose(pg.surfarray.pixels3d(obs_surface), axes=(2, 1, 0))
+    def _get_rgb_array_obs(self, pilot_index: int = 0) -> ObsType:
+        return self._frame_to_obs(self._render_frame())
+
+    def _render_frame(self) -> Surface:
+        frame: Surface = Surface(self.game.window_size)
+        self.game.render(frame)
+        return frame
+
+    @staticmethod
+    def _frame_to_obs(frame: Surface) -> np.ndarray:
+        return np.transpose(pg.surfarray.pixels3d(frame), axes=(2, 1, 0))
+
+    def _get_rays_obs(self, pilot_index: int = 0) -> ObsType:
+        plane = self.game.pilots[pilot_index].plane
+        ray_radians = np.radians(self._ray_angles + plane.rotation)
+        directions = np.stack((np.cos(ray_radians), np.sin(ray_radians)), axis=1)
+
+        nearby_crate_walls = self.game.course.overlapping(plane.position.x - self._ray_max_distance, plane.position.x + self._ray_max_distance)
+        rectangles = np.array(
+            [
+                (min_x + cw.position.x, min_y + cw.position.y, max_x + cw.position.x, max_y + cw.position.y)
+                for cw in nearby_crate_walls
+                for min_x, min_y, max_x, max_y in (polygon.bounds() for polygon in cw.polygons)
+            ],
+            dtype=np.float64
+        ).reshape(-1, 4)
+
+        return self._cast_rays(
+            origin=(plane.position.x, plane.position.y),
+            directions=directions,
+            rectangles=rectangles,
+            horizontal_lines=(-self.game.window_size.y / 2, self.game.window_size.y / 2),
+            max_distance=self._ray_max_distance
+        )
 
     def _get_info(self) -> dict[str, Any]:
+        if self.profile_systems:
+            return dict(system_profiles=self.game.system_profiles())
         return {}
 
+    def _reset_game(self) -> None:
+        self._record_episode()
+        if self.course_table is not None:
+            self.game.reset(course_table=self.course_table)
+        else:
+            # The course is seeded from the Env's generator so that it's reproducible from the seed passed to the first reset.
+            self.game.reset(seed=int(self.np_random.integers(2 ** 32)))
+
+    def _record_episode(self) -> None:
+        # Resets that follow no steps, such as the first, don't end an episode.
+        if self.telemetry is not None and self._episode_steps > 0:
+            self.telemetry.record_episode(self._episode_steps, self.game.score)
+        self._episode_steps = 0
+
+    def _record_reset(self, reset_start: float) -> None:
+        if self.telemetry is not None:
+            self.telemetry.record_reset(perf_counter() - reset_start, self.game.collision_checks)
+
+    def _advance(self, actions) -> None:
+        """
+        Step the Game once with the supplied action of each plane.
+        :param actions: An Iterable with one action per plane.
+        """
+        # The control Events are handed to the Game directly rather than through PyGame's event queue, which needs the display.
+        events: list[Event] = [
+            Event(PLANE_CONTROL_EVENT, is_pitching_up=bool(action), plane_index=plane_index)
+            for plane_index, action in enumerate(actions)
+        ]
+
+        if self.render_mode == "human":
+            self.clock.tick(self.metadata.get("render_fps"))
+            # The window's Events are still drained, ahead of the control Events, so that the window stays responsive.
+            events = pg.event.get() + events
+
+        self.game.process_events(events)
+        self.game.step()
+
+    def _advance_skipping_frames(self, actions) -> Surface | None:
+        """
+        Step the Game `frame_skip` times, or until it ends, with the supplied action of each plane.
+        :param actions: An Iterable with one action per plane.
+        :return: The frame of the second to last Game step when max-pooling frames, otherwise None.
+        """
+        actions = tuple(actions)
+        self._episode_steps += 1
+        pooled_frame: Surface | None = None
+        for frame in range(self.frame_skip):
+            self._advance(actions)
+            if self.game.next_scene is not self.game:
+                break
+            if self.max_pool_frames and frame == self.frame_skip - 2:
+                pooled_frame = self._render_frame()
+        return pooled_frame
+
+    def _get_pooled_obs(self, pooled_frame: Surface | None, pilot_index: int = 0) -> ObsType:
+        if pooled_frame is None:
+            return self._get_obs(pilot_index)
+
+        frame: Surface = self._render_frame()
+        frame.blit(pooled_frame, (0, 0), special_flags=pg.BLEND_RGB_MAX)
+        return self._frame_to_obs(frame)
+
     def reset(self, *, seed=None, options=None) -> tuple[ObsType, dict[str, Any]]:
+        reset_start: float = perf_counter()
         super().reset(seed=seed, options=options)
 
-        self.game = Game(event_handler=AgentEventHandler)
+        self._reset_game()
         self.current_score = self.game.score
 
-        return self._get_obs(), self._get_info()
+        observation, info = self._get_obs(), self._get_info()
+        self._record_reset(reset_start)
+        return observation, info
 
     def step(self, action) -> tuple[ObsType, float, bool, bool, dict[str, Any]]:
 
-        pg.event.post(pg.event.Event(PLANE_CONTROL_EVENT, is_pitching_up=bool(action)))
+        pooled_frame = self._advance_skipping_frames((action,))
 
-        if self.render_mode == "human":
-            self.clock.tick(self.metadata.get("render_fps"))
-
-        self.game.process_events(pg.event.get())
-        self.game.step()
-
-        observation = self._get_obs()
+        observation = self._get_pooled_obs(pooled_frame)
         reward: int = self.game.score - self.current_score
         self.current_score = self.game.score
         terminated: bool = self.game.next_scene is not self.game
@@ -194,10 +351,78 @@ class FlightSchool(gym.Env):
 
     def render(self):
         if self.render_mode == "human":
-            self.game.render(self.window)
-            pg.display.flip()
+            if self.presenter:
+                frame: Surface = self.presenter.acquire()
+                self.game.render(frame)
+                self.presenter.present(frame)
+            else:
+                self.game.render(self.window)
+                pg.display.flip()
             return None
 
     def close(self):
+        if self.telemetry is not None:
+            self._record_episode()
+            self.telemetry.flush()
+        if self.presenter:
+            self.presenter.close()
         if self.window:
             pg.quit()
+
+
+class FormationFlightSchool(FlightSchool):
+    """
+    A multi-agent FlightSchool in which several planes fly the same course in a single Game, such that the CrateWalls, camera, and background are shared by every plane and every policy is compared on identical obstacles.
+    Each step takes one action per plane and returns a tuple with one observation per plane, along with arrays of the rewards and terminations of each plane. A plane that has crashed is terminated, and its wreckage is left in place while the others fly on. The episode is over once every plane has crashed.
+    """
+
+    def __init__(self, render_mode, obs_type, plane_count: int = 2, **kwargs):
+        """
+        :param render_mode: One of `metadata["render_modes"]`.
+        :param obs_type: One of `metadata["obs_types"]`.
+        :param plane_count: The number of planes.
+        :param kwargs: Passed along to FlightSchool.
+        """
+        self._plane_count = plane_count
+        super().__init__(render_mode, obs_type, **kwargs)
+
+        self.single_observation_space: spaces.Space = self.observation_space
+        self.single_action_space: spaces.Space = self.action_space
+        self.observation_space = spaces.Tuple(tuple(self.single_observation_space for _ in range(plane_count)))
+        self.action_space = spaces.MultiBinary(plane_count)
+
+        self.current_scores: np.ndarray = np.zeros(plane_count, dtype=np.int64)
+
+    def _get_scores(self) -> np.ndarray:
+        return np.fromiter((pilot.score for pilot in self.game.pilots), dtype=np.int64, count=self._plane_count)
+
+    def _get_multi_obs(self, pooled_frame: Surface | None = None) -> tuple[ObsType, ...]:
+        if self.obs_type == "rgb_array":
+            # Every plane shares the camera, so a single frame is rendered.
+            observation = self._get_pooled_obs(pooled_frame)
+            return tuple(observation for _ in range(self._plane_count))
+        return tuple(self._get_obs(pilot_index) for pilot_index in range(self._plane_count))
+
+    def reset(self, *, seed=None, options=None) -> tuple[tuple[ObsType, ...], dict[str, Any]]:
+        reset_start: float = perf_counter()
+        gym.Env.reset(self, seed=seed, options=options)
+
+        self._reset_game()
+        self.current_scores = self._get_scores()
+
+        observations, info = self._get_multi_obs(), self._get_info()
+        self._record_reset(reset_start)
+        return observations, info
+
+    def step(self, actions) -> tuple[tuple[ObsType, ...], np.ndarray, np.ndarray, np.ndarray, dict[str, Any]]:
+
+        pooled_frame = self._advance_skipping_frames(np.ravel(actions))
+
+        observations = self._get_multi_obs(pooled_frame)
+        scores: np.ndarray = self._get_scores()
+        rewards: np.ndarray = scores - self.current_scores
+        self.current_scores = scores
+        terminated: np.ndarray = np.fromiter((pilot.has_crashed for pilot in self.game.pilots), dtype=bool, count=self._plane_count)
+        truncated: np.ndarray = np.zeros(self._plane_count, dtype=bool)
+        info: dict = self._get_info()
+        return observations, rewards, terminated, truncated, info
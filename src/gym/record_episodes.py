@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import os
+from typing import Any, Generator
+
+import gymnasium as gym
+import numpy as np
+from gymnasium.core import ObsType
+
+from src.gym.flight_school import FlightSchool
+from src.render.recorder import Recorder, load_episode
+from src.world.course_table import CourseTable
+
+
+class RecordEpisodes(gym.Wrapper):
+    """
+    Records every episode of a FlightSchool with a Recorder, which writes the frames and the action log of each episode from a background thread.
+    """
+
+    def __init__(self, env: gym.Env, recorder: Recorder):
+        """
+        :param env: A FlightSchool, or a wrapped FlightSchool.
+        :param recorder: The Recorder to hand each frame and action to. It's closed when the wrapper is closed.
+        """
+        super().__init__(env)
+        self.recorder: Recorder = recorder
+
+    def reset(self, *, seed=None, options=None) -> tuple[ObsType, dict[str, Any]]:
+        observation, info = self.env.reset(seed=seed, options=options)
+
+        flight_school: FlightSchool = self.env.unwrapped
+        self.recorder.begin_episode(
+            course_seed=flight_school.game.course_table.seed,
+            frame_skip=flight_school.frame_skip,
+            plane_count=len(flight_school.game.pilots)
+        )
+        self._record_frame(observation)
+        return observation, info
+
+    def step(self, action) -> tuple[ObsType, Any, Any, Any, dict[str, Any]]:
+        observation, reward, terminated, truncated, info = self.env.step(action)
+
+        self.recorder.record_action(action)
+        self._record_frame(observation)
+        if np.all(terminated) or np.all(truncated):
+            self.recorder.end_episode(score=self.env.unwrapped.game.score)
+        return observation, reward, terminated, truncated, info
+
+    def close(self):
+        self.recorder.close()
+        return super().close()
+
+    def _record_frame(self, observation: ObsType) -> None:
+        flight_school: FlightSchool = self.env.unwrapped
+        # An rgb_array observation is the frame, so it's copied rather than rendered again.
+        frame = observation if flight_school.obs_type == "rgb_array" and isinstance(observation, np.ndarray) else None
+        self.recorder.record_frame(flight_school.game, frame)
+
+
+def replay_episode(env: gym.Env, episode_directory: str | os.PathLike) -> Generator[tuple[ObsType, Any, Any, Any, dict[str, Any]], None, None]:
+    """
+    Replay the action log of an episode written by a Recorder, yielding the result of each step.
+    The course of the FlightSchool is replaced by the recorded course, which it flies in every later episode too.
+    :param env: A FlightSchool, or a wrapped FlightSchool, with the same `frame_skip` and number of planes as the recorded one.
+    :param episode_directory:
+    :return:
+    """
+    log, _ = load_episode(episode_directory)
+    flight_school: FlightSchool = env.unwrapped
+    assert flight_school.frame_skip == log["frame_skip"], "The episode was recorded with a different frame_skip."
+
+    flight_school.course_table = CourseTable(log["course_seed"])
+    env.reset()
+    for action in log["actions"]:
+        # Actions are logged as lists, which are converted back to arrays, as a list such as `[0]` would be truthy.
+        yield env.step(np.asarray(action))
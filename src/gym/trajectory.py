@@ -0,0 +1,286 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+import gymnasium as gym
+import numpy as np
+from gymnasium import spaces
+from gymnasium.core import ObsType
+
+
+class TrajectoryWriter:
+    """
+    Appends the transitions of episodes to a directory of fixed-dtype, memory-mapped `.npy` chunks, each of which holds `chunk_size` rows, along with an index of the episodes.
+    Each row holds an observation, the action taken from it, and the resulting reward, termination, and truncation. Each episode is stored as consecutive rows, the last of which holds the final observation of the episode and no action.
+    Box observations, such as rgb_array and rays observations, are stored as they are. Other observations, such as numeric observations, are stored flattened by `gymnasium.spaces.flatten`, and can be restored with `gymnasium.spaces.unflatten`.
+    Rows are gathered in an in-memory buffer of about `buffer_bytes`, and no more than a chunk, which is written to the chunks in bulk whenever it fills.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        observation_space: spaces.Space,
+        action_space: spaces.Space,
+        chunk_bytes: int = 2 ** 28,
+        buffer_bytes: int = 2 ** 24
+    ):
+        """
+        :param directory: The directory in which the chunks and index are written. Any trajectories already in it are overwritten.
+        :param observation_space:
+        :param action_space:
+        :param chunk_bytes: The approximate size of each chunk, from which the number of rows per chunk is derived.
+        :param buffer_bytes: The approximate size of the buffer of rows written to the chunks at once, from which the number of rows it holds is derived. It holds at least one row, and at most `chunk_size` rows.
+        """
+        self.directory: str = os.fspath(directory)
+        self.observation_space: spaces.Space = observation_space
+        self._flatten_observations: bool = not isinstance(observation_space, spaces.Box)
+        stored_observation_space: spaces.Space = spaces.flatten_space(observation_space) if self._flatten_observations else observation_space
+
+        self.record_dtype: np.dtype = np.dtype([
+            ("observation", stored_observation_space.dtype, stored_observation_space.shape),
+            ("action", action_space.dtype, action_space.shape),
+            ("reward", np.float32),
+            ("terminated", np.bool_),
+            ("truncated", np.bool_)
+        ])
+        self.chunk_size: int = max(chunk_bytes // self.record_dtype.itemsize, 1)
+
+        self._buffer: np.ndarray = np.zeros(min(max(buffer_bytes // self.record_dtype.itemsize, 1), self.chunk_size), dtype=self.record_dtype)
+        # The rows of the buffer before this one are complete. While an episode is open, this row holds its latest observation.
+        self._buffered_rows: int = 0
+        self._written_rows: int = 0
+        self._chunk: np.memmap | None = None
+        self._chunk_index: int = -1
+
+        self._episode_start: int | None = None
+        self._episodes: list[tuple[int, int]] = []
+
+        os.makedirs(self.directory, exist_ok=True)
+
+    @property
+    def row_count(self) -> int:
+        return self._written_rows + self._buffered_rows
+
+    def begin_episode(self, observation: ObsType) -> None:
+        """
+        Start a new episode from the observation returned by `reset`, ending the current episode if there is one.
+        :param observation:
+        """
+        if self._episode_start is not None:
+            self._end_episode()
+        self._episode_start = self.row_count
+        self._set_observation(observation)
+
+    def add(self, action, reward: float, terminated: bool, truncated: bool, observation: ObsType) -> None:
+        """
+        Append a step of the current episode, as returned by `step`. The episode ends when the step terminates or truncates it.
+        :param action: The action taken from the previous observation.
+        :param reward:
+        :param terminated:
+        :param truncated:
+        :param observation: The observation resulting from the action.
+        """
+        row = self._buffer[self._buffered_rows]
+        row["action"] = action
+        row["reward"] = reward
+        row["terminated"] = terminated
+        row["truncated"] = truncated
+        self._complete_row()
+
+        self._set_observation(observation)
+        if terminated or truncated:
+            self._end_episode()
+
+    def flush(self) -> None:
+        """
+        Write the buffered rows, the index of episodes, and the metadata needed to read them, such that a TrajectoryReader opened afterward reads every ended episode.
+        """
+        self._write_buffer()
+        if self._chunk is not None:
+            self._chunk.flush()
+
+        np.save(os.path.join(self.directory, "episodes.npy"), np.array(self._episodes, dtype=TrajectoryReader.episode_dtype).reshape(-1), allow_pickle=False)
+        with open(os.path.join(self.directory, "trajectory.json"), "w") as file:
+            json.dump(dict(chunk_size=self.chunk_size, row_count=self._written_rows, flattened_observations=self._flatten_observations), file)
+
+    def close(self) -> None:
+        """
+        End the current episode, if there is one, and flush.
+        """
+        if self._episode_start is not None:
+            self._end_episode()
+        self.flush()
+        self._chunk = None
+
+    def _set_observation(self, observation: ObsType) -> None:
+        if self._flatten_observations:
+            observation = spaces.flatten(self.observation_space, observation)
+        self._buffer[self._buffered_rows]["observation"] = observation
+
+    def _end_episode(self) -> None:
+        # The final observation has no action, reward, or outcome of its own.
+        row = self._buffer[self._buffered_rows]
+        row["action"] = 0
+        row["reward"] = 0
+        row["terminated"] = False
+        row["truncated"] = False
+        self._complete_row()
+
+        self._episodes.append((self._episode_start, self.row_count - self._episode_start))
+        self._episode_start = None
+
+    def _complete_row(self) -> None:
+        self._buffered_rows += 1
+        if self._buffered_rows == len(self._buffer):
+            self._write_buffer()
+
+    def _write_buffer(self) -> None:
+        # An open episode's latest observation is carried over to the start of the emptied buffer.
+        rows = self._buffer[:self._buffered_rows]
+        while len(rows):
+            chunk_index, offset = divmod(self._written_rows, self.chunk_size)
+            if chunk_index != self._chunk_index:
+                if self._chunk is not None:
+                    self._chunk.flush()
+                self._chunk = np.lib.format.open_memmap(
+                    os.path.join(self.directory, f"chunk_{chunk_index:06d}.npy"),
+                    mode="w+",
+                    dtype=self.record_dtype,
+                    shape=(self.chunk_size,)
+                )
+                self._chunk_index = chunk_index
+
+            written = min(len(rows), self.chunk_size - offset)
+            self._chunk[offset:offset + written] = rows[:written]
+            rows = rows[written:]
+            self._written_rows += written
+
+        if self._buffered_rows < len(self._buffer):
+            self._buffer[0] = self._buffer[self._buffered_rows]
+        self._buffered_rows = 0
+
+
+class TrajectoryReader:
+    """
+    Reads the trajectories written by a TrajectoryWriter from memory-mapped, read-only chunks, such that only the pages of the rows that are read are loaded, and any number of processes share them.
+    """
+
+    episode_dtype: np.dtype = np.dtype([("start", "<i8"), ("length", "<i8")])
+
+    def __init__(self, directory: str | os.PathLike):
+        """
+        :param directory: A directory written by a TrajectoryWriter.
+        """
+        self.directory: str = os.fspath(directory)
+        with open(os.path.join(self.directory, "trajectory.json")) as file:
+            metadata: dict[str, Any] = json.load(file)
+        self.chunk_size: int = metadata["chunk_size"]
+        self.row_count: int = metadata["row_count"]
+        self.flattened_observations: bool = metadata["flattened_observations"]
+
+        self.episodes: np.ndarray = np.load(os.path.join(self.directory, "episodes.npy"), allow_pickle=False)
+        self.chunks: list[np.ndarray] = [
+            np.load(os.path.join(self.directory, f"chunk_{chunk_index:06d}.npy"), mmap_mode="r", allow_pickle=False)
+            for chunk_index in range(-(-self.row_count // self.chunk_size))
+        ]
+
+        # Every row of an episode, other than its last, begins a transition.
+        self.transition_rows: np.ndarray = np.concatenate(
+            [np.arange(start, start + length - 1) for start, length in self.episodes] or [np.empty(0, dtype=np.int64)]
+        )
+
+    def __len__(self) -> int:
+        """
+        Return the number of transitions.
+        """
+        return len(self.transition_rows)
+
+    def episode(self, episode_index: int) -> np.ndarray:
+        """
+        Return the rows of the specified episode. If the episode lies within a single chunk, the rows are a read-only view of the memory-mapped chunk, rather than a copy.
+        :param episode_index:
+        :return:
+        """
+        start, length = (int(n) for n in self.episodes[episode_index])
+        return self.rows(start, start + length)
+
+    def rows(self, start: int, end: int) -> np.ndarray:
+        """
+        Return the rows from `start` up to `end`, as a view of a memory-mapped chunk if they lie within one, or otherwise as a copy.
+        :param start:
+        :param end:
+        :return:
+        """
+        first_chunk, first_offset = divmod(start, self.chunk_size)
+        last_chunk, last_offset = divmod(end - 1, self.chunk_size)
+        if first_chunk == last_chunk:
+            return self.chunks[first_chunk][first_offset:last_offset + 1]
+        return np.concatenate(
+            [self.chunks[first_chunk][first_offset:]]
+            + self.chunks[first_chunk + 1:last_chunk]
+            + [self.chunks[last_chunk][:last_offset + 1]]
+        )
+
+    def gather(self, row_indices: np.ndarray) -> np.ndarray:
+        """
+        Return a copy of the rows at the specified indices, reading only those rows from each chunk.
+        :param row_indices:
+        :return:
+        """
+        gathered: np.ndarray = np.empty(len(row_indices), dtype=self.chunks[0].dtype)
+        chunk_indices, offsets = np.divmod(row_indices, self.chunk_size)
+        for chunk_index in np.unique(chunk_indices):
+            selected = chunk_indices == chunk_index
+            gathered[selected] = self.chunks[chunk_index][offsets[selected]]
+        return gathered
+
+    def sample(self, batch_size: int, rng: np.random.Generator | None = None) -> dict[str, np.ndarray]:
+        """
+        Return a minibatch of transitions drawn uniformly at random, with replacement.
+        :param batch_size:
+        :param rng: The generator from which the transitions are drawn. If None, a new, randomly seeded generator is used.
+        :return: A dict of arrays of the `observation`, `action`, `reward`, `terminated`, and `truncated` of each transition, and the `next_observation` that resulted from it.
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        row_indices: np.ndarray = self.transition_rows[rng.integers(len(self.transition_rows), size=batch_size)]
+        # The rows and the rows after them are read together, so that each chunk is visited once.
+        rows: np.ndarray = self.gather(np.concatenate((row_indices, row_indices + 1)))
+        transitions, next_rows = rows[:batch_size], rows[batch_size:]
+        return dict(
+            observation=transitions["observation"],
+            action=transitions["action"],
+            reward=transitions["reward"],
+            terminated=transitions["terminated"],
+            truncated=transitions["truncated"],
+            next_observation=next_rows["observation"]
+        )
+
+
+class RecordTrajectories(gym.Wrapper):
+    """
+    Appends every transition of the wrapped environment to a TrajectoryWriter.
+    """
+
+    def __init__(self, env: gym.Env, writer: TrajectoryWriter):
+        """
+        :param env:
+        :param writer: The TrajectoryWriter to append the transitions to. It's closed when the wrapper is closed.
+        """
+        super().__init__(env)
+        self.writer: TrajectoryWriter = writer
+
+    def reset(self, *, seed=None, options=None) -> tuple[ObsType, dict[str, Any]]:
+        observation, info = self.env.reset(seed=seed, options=options)
+        self.writer.begin_episode(observation)
+        return observation, info
+
+    def step(self, action) -> tuple[ObsType, Any, bool, bool, dict[str, Any]]:
+        observation, reward, terminated, truncated, info = self.env.step(action)
+        self.writer.add(action, reward, terminated, truncated, observation)
+        return observation, reward, terminated, truncated, info
+
+    def close(self):
+        self.writer.close()
+        return super().close()
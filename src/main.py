@@ -1,9 +1,16 @@
+from __future__ import annotations
+
+import sys
+
 import pygame as pg
 
 import src.scene.scene_manager as scene_manager
+from src.render.presenter import Presenter
 from src.scene.splash import Splash
 
-pg.init()
+# Only the subsystems that the game uses are initialized. Audio, in particular, is slow to initialize and never used.
+pg.display.init()
+pg.font.init()
 
 pg.display.set_caption("Plain Paper Plane")
 pg.display.set_icon(pg.image.load("res/plane.ico"))
@@ -11,6 +18,9 @@ pg.display.set_icon(pg.image.load("res/plane.ico"))
 screen = pg.display.set_mode(size=(1280, 720))
 clock = pg.time.Clock()
 
+# Optionally, frames are presented to the window from a separate thread, which not every platform supports.
+presenter: Presenter | None = Presenter(screen) if "--present-in-thread" in sys.argv else None
+
 scene_manager.set_scene(Splash())
 
 while scene_manager.current_scene:
@@ -18,11 +28,18 @@ while scene_manager.current_scene:
     scene_manager.process_events(pg.event.get())
     scene_manager.step()
 
-    scene_manager.render(screen)
-    pg.display.flip()
+    if presenter:
+        frame = presenter.acquire()
+        scene_manager.render(frame)
+        presenter.present(frame)
+    else:
+        scene_manager.render(screen)
+        pg.display.flip()
 
     scene_manager.set_scene(scene_manager.current_scene.next_scene)
 
     clock.tick(60)
 
+if presenter:
+    presenter.close()
 pg.quit()
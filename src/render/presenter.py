@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+
+import pygame as pg
+from pygame import Surface
+
+
+class Presenter:
+    """
+    Presents frames to the display window from a background thread, such that the thread that renders the frames never waits on the window being updated.
+    Frames are rendered into one of `buffer_count` Surfaces taken with `acquire`, and handed back with `present`. Only the latest frame is ever waiting to be presented: a frame that's replaced before the display thread takes it is dropped, rather than queued, and its Surface is reused.
+
+    Not every platform, notably macOS, supports updating the window from a thread other than the one that opened it, so presenting from a thread is optional.
+    """
+
+    def __init__(self, window: Surface, buffer_count: int = 3):
+        """
+        :param window: The display Surface returned by `pygame.display.set_mode`.
+        :param buffer_count: The number of frame Surfaces, which is at least 2, such that one can always be acquired without waiting.
+        """
+        assert buffer_count >= 2, "At least two buffers are needed for one to be presented while another is rendered."
+        self.window: Surface = window
+        self.presented_frames: int = 0
+        self.dropped_frames: int = 0
+
+        self._free_buffers: list[Surface] = [Surface(window.get_size()) for _ in range(buffer_count)]
+        self._latest_frame: Surface | None = None
+        self._is_closing: bool = False
+        self._condition: threading.Condition = threading.Condition()
+
+        self._display_thread: threading.Thread = threading.Thread(target=self._display, name="Presenter", daemon=True)
+        self._display_thread.start()
+
+    def acquire(self) -> Surface:
+        """
+        Return a Surface, the size of the window, into which to render the next frame. If every other Surface is in use, the latest frame is dropped and its Surface is returned, so this never waits.
+        :return:
+        """
+        with self._condition:
+            if self._free_buffers:
+                return self._free_buffers.pop()
+
+            # At most one Surface is being presented, so the latest frame is waiting to be presented.
+            frame, self._latest_frame = self._latest_frame, None
+            self.dropped_frames += 1
+            return frame
+
+    def present(self, frame: Surface) -> None:
+        """
+        Hand a rendered frame, acquired with `acquire`, to the display thread, replacing the latest frame if it hasn't been presented yet.
+        :param frame:
+        """
+        with self._condition:
+            if self._latest_frame is not None:
+                self._free_buffers.append(self._latest_frame)
+                self.dropped_frames += 1
+            self._latest_frame = frame
+            self._condition.notify_all()
+
+    def close(self) -> None:
+        """
+        Present the latest frame, if it hasn't been presented yet, and stop the display thread.
+        """
+        with self._condition:
+            self._is_closing = True
+            self._condition.notify_all()
+        self._display_thread.join()
+
+    def _display(self) -> None:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._latest_frame is not None or self._is_closing)
+                if self._latest_frame is None:
+                    return
+                frame, self._latest_frame = self._latest_frame, None
+
+            self.window.blit(frame, (0, 0))
+            # The window now holds a copy of the frame, so its Surface is freed before waiting on the flip.
+            with self._condition:
+                self._free_buffers.append(frame)
+            pg.display.flip()
+            self.presented_frames += 1
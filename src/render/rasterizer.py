@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+from pygame import SRCALPHA, Rect, Surface, Vector2
+from pygame.surfarray import pixels3d, pixels_alpha
+from pygame.transform import rotate
+
+from src.scene.game import Game
+from src.world.camera import Camera
+from src.world.component import AtlasTexture, Texture, TileWrapTexture, Transform
+from src.world.plane import Plane
+
+
+class Sprite:
+    """
+    The pixels of a Surface, decoded into a channel-first (3, height, width) array of colors and, for Surfaces with per-pixel alpha, a (height, width) array of alphas.
+    The rows of the Sprite are divided into bands that are entirely opaque, entirely transparent, or neither, so that opaque bands are copied and transparent bands are skipped rather than blended.
+    """
+
+    __slots__ = ("color", "alpha", "width", "height", "bands")
+
+    def __init__(self, surface: Surface):
+        self.width: int
+        self.height: int
+        self.width, self.height = surface.get_size()
+        self.color: np.ndarray = np.ascontiguousarray(np.transpose(pixels3d(surface), axes=(2, 1, 0)))
+        self.alpha: np.ndarray | None = None
+
+        # Each band is a (first row, end row, kind) triple, where kind is "opaque", "transparent", or "blend".
+        row_kinds: list[str] = ["opaque"] * self.height
+        if surface.get_flags() & SRCALPHA:
+            self.alpha = np.ascontiguousarray(np.transpose(pixels_alpha(surface))).astype(np.int32)
+            row_kinds = [
+                "opaque" if row.min() == 255 else "transparent" if row.max() == 0 else "blend"
+                for row in self.alpha
+            ]
+
+        self.bands: list[tuple[int, int, str]] = []
+        for row, kind in enumerate(row_kinds):
+            if self.bands and self.bands[-1][2] == kind:
+                self.bands[-1] = (self.bands[-1][0], row + 1, kind)
+            else:
+                self.bands.append((row, row + 1, kind))
+
+    def draw(self, target: np.ndarray, left: int, top: int) -> None:
+        """
+        Alpha blend the Sprite onto a channel-first (3, height, width) uint8 target, with the top left corner of the Sprite at (`left`, `top`), using the same integer arithmetic as PyGame's blits.
+        :param target:
+        :param left:
+        :param top:
+        """
+        _, target_height, target_width = target.shape
+        column_start = max(-left, 0)
+        column_end = min(target_width - left, self.width)
+        if column_start >= column_end:
+            return
+
+        for band_start, band_end, kind in self.bands:
+            if kind == "transparent":
+                continue
+            row_start = max(band_start, -top)
+            row_end = min(band_end, target_height - top)
+            if row_start >= row_end:
+                continue
+
+            destination = target[:, top + row_start:top + row_end, left + column_start:left + column_end]
+            source = self.color[:, row_start:row_end, column_start:column_end]
+            if kind == "opaque":
+                destination[...] = source
+            else:
+                alpha = self.alpha[row_start:row_end, column_start:column_end]
+                blended = destination.astype(np.int32)
+                blended += ((source - blended) * alpha + source) >> 8
+                destination[...] = blended
+
+
+class Rasterizer:
+    """
+    A headless renderer that composites the frames of Games from pre-decoded Sprite arrays with NumPy slicing, rather than PyGame rotations and blits, and renders the frames of many Games into a single (games, 3, height, width) batch.
+    Only the plane is ever rotated, so its rotated Sprites are decoded once per rotation and kept in a table. The background and the regions of the texture atlas that make up CrateWalls are axis-aligned, so they're drawn by slicing.
+
+    Tolerance: with a `rotation_step` of None, frames match `Game.render` pixel-for-pixel. Otherwise, the rotation of each plane is rounded to the nearest multiple of `rotation_step` degrees, so only the pixels within the bounds of a plane Sprite differ, while every other pixel matches.
+    Where the rounded rotation changes the size of the rotated Sprite, the plane is also placed a pixel away. With the default `rotation_step` of 0.5, over 20,000 random rotations and positions measured by `python -m src.bench.rasterizer 20000`, at most 276 pixels differed per plane, 26.7 on average, by at most 201 in any color channel.
+    """
+
+    def __init__(self, rotation_step: float | None = 0.5):
+        """
+        :param rotation_step: The resolution, in degrees, of the table of rotated plane Sprites, or None to decode a Sprite for every distinct rotation without keeping them.
+        """
+        self.rotation_step: float | None = rotation_step
+        self._tile_wrap_sprites: dict[type, Sprite] = {}
+        self._atlas_sprites: dict[tuple[int, int, int, int, int], Sprite] = {}
+        self._plane_sprites: dict[float, Sprite] = {}
+        self._score_sprites: dict[int, Sprite] = {}
+
+    def render(self, games: Sequence[Game], out: np.ndarray | None = None) -> np.ndarray:
+        """
+        Render a frame of each of the supplied Games.
+        :param games:
+        :param out: An optional uint8 array shaped (len(games), 3, height, width) into which the frames are rendered.
+        :return: The uint8 array of frames, shaped (len(games), 3, height, width).
+        """
+        if out is None:
+            out = np.empty((len(games), 3, int(Game.window_size.y), int(Game.window_size.x)), dtype=np.uint8)
+        for game, frame in zip(games, out):
+            self.render_game(game, frame)
+        return out
+
+    def render_game(self, game: Game, frame: np.ndarray) -> None:
+        """
+        Render a frame of the Game into a channel-first (3, height, width) uint8 array, as `Game.render` would render it to a Surface.
+        :param game:
+        :param frame:
+        """
+        game.prepare_background()
+        camera: Camera = game.camera
+        camera_offset: Vector2 = camera.anchor - camera.position
+
+        entities = sorted(
+            (
+                entity for entity in game.world.query()
+                if isinstance(entity, (Texture, AtlasTexture)) and isinstance(entity, Transform) and not isinstance(entity, Camera)
+            ),
+            key=lambda entity: entity.render_height
+        )
+        for entity in entities:
+            if isinstance(entity, AtlasTexture):
+                self._draw_atlas_texture(entity, frame, camera_offset)
+                continue
+
+            if isinstance(entity, TileWrapTexture):
+                self._draw_tile_wrap_texture(game, entity, frame, camera_offset)
+                continue
+
+            sprite: Sprite = self._get_sprite(entity)
+            rect = Rect((0, 0), (sprite.width, sprite.height))
+            rect.center = entity.position - entity.anchor.rotate(entity.rotation) + camera_offset
+            sprite.draw(frame, rect.left, rect.top)
+
+        score_sprite: Sprite | None = self._score_sprites.get(game.score)
+        if score_sprite is None:
+            score_sprite = self._score_sprites[game.score] = Sprite(game.score_surface)
+        score_sprite.draw(frame, int(frame.shape[2] / 2), 10)
+
+    def _draw_atlas_texture(self, entity: AtlasTexture | Transform, frame: np.ndarray, camera_offset: Vector2) -> None:
+        rect = Rect((0, 0), entity.size)
+        rect.center = entity.position - entity.anchor + camera_offset
+        for region, (offset_x, offset_y) in entity.regions:
+            key = (id(entity.atlas), *region)
+            sprite: Sprite | None = self._atlas_sprites.get(key)
+            if sprite is None:
+                sprite = self._atlas_sprites[key] = Sprite(entity.atlas.subsurface(region))
+            sprite.draw(frame, rect.left + offset_x, rect.top + offset_y)
+
+    def _get_sprite(self, entity: Texture | Transform) -> Sprite:
+        if isinstance(entity, Plane) and self.rotation_step is not None:
+            rotation: float = round(entity.rotation / self.rotation_step) * self.rotation_step % 360
+            sprite = self._plane_sprites.get(rotation)
+            if sprite is None:
+                # PyGame mixes rotation handedness between modules.
+                sprite = self._plane_sprites[rotation] = Sprite(rotate(entity.surface, -rotation))
+            return sprite
+
+        return Sprite(rotate(entity.surface, -entity.rotation))
+
+    def _draw_tile_wrap_texture(self, game: Game, entity: TileWrapTexture, frame: np.ndarray, camera_offset: Vector2) -> None:
+        sprite: Sprite | None = self._tile_wrap_sprites.get(type(entity))
+        if sprite is None:
+            sprite = self._tile_wrap_sprites[type(entity)] = Sprite(entity.expanded_surface)
+
+        # The same parallax shift as the Parallax System, which PyGame truncates when taking the subsurface.
+        parallax = game.parallax_system
+        camera_displacement: Vector2 = parallax.camera.position - parallax.parallax_origin
+        shift_left: int = int((camera_displacement.x * parallax.parallax_factor[0]) % entity.base_image_size[0])
+        shift_top: int = int((camera_displacement.y * parallax.parallax_factor[1]) % entity.base_image_size[1])
+
+        rect = Rect((0, 0), entity.subsurface_size)
+        rect.center = entity.position - entity.anchor.rotate(entity.rotation) + camera_offset
+
+        # Only the part of the subsurface that lands within the frame is copied.
+        _, frame_height, frame_width = frame.shape
+        left, top = max(rect.left, 0), max(rect.top, 0)
+        right, bottom = min(rect.right, frame_width), min(rect.bottom, frame_height)
+        if left >= right or top >= bottom:
+            return
+        source_left = shift_left + left - rect.left
+        source_top = shift_top + top - rect.top
+        frame[:, top:bottom, left:right] = sprite.color[:, source_top:source_top + bottom - top, source_left:source_left + right - left]
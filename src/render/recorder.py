@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+from collections import deque
+from typing import Any, BinaryIO
+
+import numpy as np
+import pygame as pg
+
+from src.render.rasterizer import Rasterizer
+from src.scene.game import Game
+
+
+class Recorder:
+    """
+    Records episodes to disk from a background thread, such that the thread that steps the Game only renders, or copies, each frame into a preallocated buffer and never waits on a file.
+    Each episode is written to its own numbered directory, holding an `episode.json` of the course seed, the actions taken, and the steps whose frames were recorded, along with the frames themselves:
+    either `frames.raw`, the recorded frames as consecutive uint8 arrays shaped (3, height, width), or a sequence of `frame_<step>.png` files.
+    With a `frame_format` of None, only `episode.json` is written, which is enough to replay the episode exactly.
+
+    The number of buffers bounds the frames that may be waiting to be written. When every buffer is waiting, `drop_policy` decides what happens to a new frame:
+    "drop_newest" drops the new frame, "drop_oldest" drops the oldest frame that's still waiting to be written in favor of the new frame, and "block" waits for the worker to free a buffer, which applies backpressure to the simulation rather than dropping frames.
+
+    If the worker fails to write, such as when the disk is full, it stops, and the error is raised as the cause of a RuntimeError from every later call to `record_frame`, `end_episode`, or `close`.
+    """
+
+    frame_formats: tuple[str | None, ...] = ("raw", "png", None)
+    drop_policies: tuple[str, ...] = ("drop_newest", "drop_oldest", "block")
+
+    def __init__(
+        self,
+        directory: str | os.PathLike,
+        frame_format: str | None = "raw",
+        buffer_count: int = 32,
+        drop_policy: str = "drop_newest",
+        rasterizer: Rasterizer | None = None
+    ):
+        """
+        :param directory: The directory in which a directory is created for each episode.
+        :param frame_format: One of `Recorder.frame_formats`.
+        :param buffer_count: The number of frames that may be waiting to be written at once.
+        :param drop_policy: One of `Recorder.drop_policies`.
+        :param rasterizer: The Rasterizer with which Games are rendered. If None, a Rasterizer is created with its default tolerance.
+        """
+        assert frame_format in self.frame_formats, f"frame_format must be one of {self.frame_formats}."
+        assert drop_policy in self.drop_policies, f"drop_policy must be one of {self.drop_policies}."
+        assert buffer_count >= 1, "At least one buffer is needed to record frames."
+
+        self.directory: str = os.fspath(directory)
+        self.frame_format: str | None = frame_format
+        self.drop_policy: str = drop_policy
+        self.rasterizer: Rasterizer = rasterizer or Rasterizer()
+        self.frame_shape: tuple[int, int, int] = (3, int(Game.window_size.y), int(Game.window_size.x))
+
+        self.recorded_frames: int = 0
+        self.dropped_frames: int = 0
+
+        self._free_buffers: list[np.ndarray] = [np.empty(self.frame_shape, dtype=np.uint8) for _ in range(buffer_count if frame_format else 0)]
+        # Each item is ("frame", episode directory, step, buffer), ("episode", episode directory, log), or None to stop the worker.
+        self._pending: deque[tuple | None] = deque()
+        self._condition: threading.Condition = threading.Condition()
+        self._worker_error: Exception | None = None
+
+        self._episode_index: int = 0
+        self._episode_directory: str | None = None
+        self._episode_log: dict[str, Any] | None = None
+        self._step: int = 0
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._worker: threading.Thread = threading.Thread(target=self._work, name="Recorder", daemon=True)
+        self._worker.start()
+
+    def begin_episode(self, course_seed: int, **metadata) -> None:
+        """
+        Start recording a new episode, ending the current one if there is one.
+        :param course_seed: The seed of the course flown in the episode.
+        :param metadata: Further JSON-serializable values to store in the episode's `episode.json`, such as the options needed to replay it.
+        """
+        if self._episode_log is not None:
+            self.end_episode()
+
+        self._episode_directory = os.path.join(self.directory, f"episode_{self._episode_index:06d}")
+        self._episode_index += 1
+        os.makedirs(self._episode_directory, exist_ok=True)
+        self._episode_log = dict(course_seed=course_seed, **metadata, frame_format=self.frame_format, frame_shape=self.frame_shape, actions=[])
+        self._step = 0
+
+    def record_action(self, action) -> None:
+        """
+        Append the action taken in the current step to the action log, and advance to the next step.
+        :param action: A boolean, or an Iterable of one boolean per plane.
+        """
+        self._episode_log["actions"].append(np.asarray(action, dtype=int).tolist())
+        self._step += 1
+
+    def record_frame(self, game: Game, frame: np.ndarray | None = None) -> bool:
+        """
+        Hand the current frame of the Game to the worker, to be written in the background.
+        :param game: The Game, which is rendered with the Recorder's Rasterizer unless `frame` is supplied.
+        :param frame: Optionally, an already rendered uint8 frame shaped (3, height, width), such as an rgb_array observation, which is copied rather than rendering the Game again.
+        :return: Whether the frame was kept, rather than dropped.
+        """
+        self._raise_worker_error()
+        if self.frame_format is None:
+            return False
+
+        buffer: np.ndarray | None = self._take_buffer()
+        if buffer is None:
+            self.dropped_frames += 1
+            return False
+
+        if frame is None:
+            self.rasterizer.render_game(game, buffer)
+        else:
+            np.copyto(buffer, frame)
+
+        with self._condition:
+            self._pending.append(("frame", self._episode_directory, self._step, buffer))
+            self._condition.notify_all()
+        self.recorded_frames += 1
+        return True
+
+    def end_episode(self, **metadata) -> None:
+        """
+        Finish recording the current episode, whose `episode.json` is written once every one of its frames has been written.
+        :param metadata: Further JSON-serializable values to store in the episode's `episode.json`, such as its final score.
+        """
+        self._raise_worker_error()
+        if self._episode_log is None:
+            return
+
+        self._episode_log.update(metadata)
+        with self._condition:
+            self._pending.append(("episode", self._episode_directory, self._episode_log))
+            self._condition.notify_all()
+        self._episode_directory = None
+        self._episode_log = None
+
+    def close(self) -> None:
+        """
+        End the current episode, wait for the worker to write everything that's pending, and stop the worker.
+        """
+        try:
+            self.end_episode()
+        finally:
+            with self._condition:
+                self._pending.append(None)
+                self._condition.notify_all()
+            self._worker.join()
+        self._raise_worker_error()
+
+    def _raise_worker_error(self) -> None:
+        if self._worker_error is not None:
+            raise RuntimeError("The Recorder's worker failed to write, so the recording is incomplete.") from self._worker_error
+
+    def _take_buffer(self) -> np.ndarray | None:
+        with self._condition:
+            if self._free_buffers:
+                return self._free_buffers.pop()
+
+            if self.drop_policy == "block":
+                self._condition.wait_for(lambda: self._free_buffers or self._worker_error is not None)
+                self._raise_worker_error()
+                return self._free_buffers.pop()
+
+            if self.drop_policy == "drop_oldest":
+                for item in self._pending:
+                    if item is not None and item[0] == "frame":
+                        self._pending.remove(item)
+                        self.recorded_frames -= 1
+                        self.dropped_frames += 1
+                        return item[3]
+
+            # Every buffer is being written by the worker, so there's nothing older to drop.
+            return None
+
+    def _work(self) -> None:
+        # The frame file and the steps of the recorded frames of each episode that's still being written.
+        frame_files: dict[str, BinaryIO] = {}
+        recorded_steps: dict[str, list[int]] = {}
+
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._pending)
+                    item = self._pending.popleft()
+                if item is None:
+                    return
+                self._write(item, frame_files, recorded_steps)
+        except Exception as error:
+            # The error is kept to be raised on the recording thread, which is woken in case it's waiting on a buffer that will never be freed.
+            with self._condition:
+                self._worker_error = error
+                self._condition.notify_all()
+        finally:
+            for frame_file in frame_files.values():
+                frame_file.close()
+
+    def _write(self, item: tuple, frame_files: dict[str, BinaryIO], recorded_steps: dict[str, list[int]]) -> None:
+        if item[0] == "frame":
+            _, episode_directory, step, buffer = item
+            if self.frame_format == "raw":
+                if episode_directory not in frame_files:
+                    frame_files[episode_directory] = open(os.path.join(episode_directory, "frames.raw"), "wb")
+                frame_files[episode_directory].write(buffer.data)
+            else:
+                surface = pg.surfarray.make_surface(np.transpose(buffer, axes=(2, 1, 0)))
+                pg.image.save(surface, os.path.join(episode_directory, f"frame_{step:06d}.png"))
+            recorded_steps.setdefault(episode_directory, []).append(step)
+
+            with self._condition:
+                self._free_buffers.append(buffer)
+                self._condition.notify_all()
+
+        else:
+            _, episode_directory, log = item
+            if episode_directory in frame_files:
+                frame_files.pop(episode_directory).close()
+            log["frame_steps"] = recorded_steps.pop(episode_directory, [])
+            with open(os.path.join(episode_directory, "episode.json"), "w") as file:
+                json.dump(log, file)
+
+
+def load_episode(episode_directory: str | os.PathLike) -> tuple[dict[str, Any], np.ndarray | None]:
+    """
+    Read an episode written by a Recorder.
+    :param episode_directory:
+    :return: The contents of the episode's `episode.json`, and, for raw frames, a read-only memory-mapped array of the recorded frames shaped (frames, 3, height, width), otherwise None.
+    """
+    with open(os.path.join(episode_directory, "episode.json")) as file:
+        log: dict[str, Any] = json.load(file)
+
+    frames: np.ndarray | None = None
+    if log["frame_format"] == "raw" and log["frame_steps"]:
+        frames = np.memmap(os.path.join(episode_directory, "frames.raw"), dtype=np.uint8, mode="r", shape=(len(log["frame_steps"]), *log["frame_shape"]))
+    return log, frames
@@ -1,8 +1,7 @@
 from __future__ import annotations
 
 import math
-import random
-from typing import Callable
+from typing import Any, Callable
 
 import pygame as pg
 from pygame import Surface, Vector2
@@ -10,14 +9,17 @@ from pygame.color import Color
 from pygame.event import Event
 from pygame.font import Font
 
-import src.scene.game_over as game_over
+from src.ecs.ecs import System
+from src.ecs.scheduler import Scheduler
 from src.event.event_handler import EventHandler
 from src.scene.scene import Scene
 from src.world.background import Background
 from src.world.camera import Camera
+from src.world.course import Course
+from src.world.course_table import CourseTable
 from src.world.crate_wall import CrateWall
 from src.world.plane import Plane
-from src.world.system import DetectCollisions, Move, Parallax, Render
+from src.world.system import DetectCollisions, DetectSweptCollisions, Move, Parallax, Render
 from src.world.world import World
 
 
@@ -33,11 +35,29 @@ class DefaultEventHandler(EventHandler):
             return self.set_plane_is_pitching_up(False)
 
 
+class Pilot:
+    """
+    One of the planes of a Game, along with the state of that plane's flight.
+    """
+
+    __slots__ = ("plane", "score", "is_pitching_up", "has_crashed")
+
+    def __init__(self, plane: Plane):
+        self.plane: Plane = plane
+        # Also the number of CrateWalls of the course that the plane has passed.
+        self.score: int = 0
+        self.is_pitching_up: bool = False
+        self.has_crashed: bool = False
+
+
 class Game(Scene):
 
     window_size: Vector2 = Vector2(1280, 720)
 
     def __init__(self, **init_data):
+        """
+        :param init_data: Optionally, `event_handler`: the EventHandler type used to control the planes; `plane_count`: the number of planes that fly the same course, each of which is controlled independently; `seed` or `course_table`: the course to fly; and `profile_systems`: whether to profile the Game's Systems.
+        """
         super().__init__(**init_data)
 
         self.world: World = World()
@@ -49,53 +69,167 @@ class Game(Scene):
         )
         self.world.add(self.camera)
 
-        self.background: Background = Background(render_height=-1)
-        self.background.position = self.camera.position - self.camera.anchor
-        self.world.add(self.background)
-
-        self.plane: Plane = Plane(
-            position=Vector2(0, 0),
-            rotation=0,
-            render_height=0,
-            linear_velocity=Vector2(10, 0),
-            angular_velocity=0
+        # The Background is only loaded once the Game is first rendered, as headless Games never draw it.
+        self.background: Background | None = None
+
+        self.course: Course = Course()
+
+        self.pilots: tuple[Pilot, ...] = tuple(
+            Pilot(
+                Plane(
+                    position=Vector2(0, 0),
+                    rotation=0,
+                    render_height=0,
+                    linear_velocity=Vector2(10, 0),
+                    angular_velocity=0
+                )
+            )
+            for _ in range(init_data.get("plane_count", 1))
         )
-        self.world.add(self.plane)
+        self.world.add(*(pilot.plane for pilot in self.pilots))
+        self.plane: Plane = self.pilots[0].plane
+        self.plane_collision_radius: float = max(vertex.length() for polygon in self.plane.polygons for vertex in polygon.vertices)
 
         self.render_system: Render = Render(camera=self.camera)
         self.move_system: Move = Move()
         self.parallax_system: Parallax = Parallax(
             camera=self.camera,
-            parallax_origin=self.background.position,
+            parallax_origin=self.camera.position - self.camera.anchor,
             parallax_factor=(0.2, 0)
         )
-        self.collision_detection_system: DetectCollisions = DetectCollisions()
-
+        self.collision_detection_system: DetectCollisions = DetectSweptCollisions()
+        # The number of pairs of a plane and a CrateWall checked for a collision, over every flight of the Game.
+        self.collision_checks: int = 0
+        self.systems: dict[str, System] = dict(
+            move=self.move_system,
+            parallax=self.parallax_system,
+            render=self.render_system,
+            collision_detection=self.collision_detection_system
+        )
+        # Collisions are only detected between the plane and the CrateWalls that the Course reports as overlapping it,
+        # so the collision detection System is called directly rather than over the whole World.
+        self.motion_schedule: Scheduler = Scheduler(self.move_system)
+        self.render_schedule: Scheduler = Scheduler(self.parallax_system, self.render_system)
+        if init_data.get("profile_systems", False):
+            self.enable_profiling()
+
+        # A CourseTable that has generated nothing yet is empty, and so falsy, so it's compared with None.
+        course_table: CourseTable | None = init_data.get("course_table")
+        self.course_table: CourseTable = course_table if course_table is not None else CourseTable(init_data.get("seed"))
+        self.crate_walls_spawned: int = 0
         self.distance_for_next_wall: float = 0
-        self.score: int = 0
         self.score_font_color: Color = Color(0, 0, 0)
         self.score_font: Font = Font("freesansbold.ttf", 48)
-        self.score_surface: Surface = self.score_font.render(str(self.score), True, self.score_font_color)
+        self.initial_score_surface: Surface = self.score_font.render(str(0), True, self.score_font_color)
+        self.score_surface: Surface = self.initial_score_surface
 
         self.scene_state: Callable[[], None] = self.initial_cruise
         self.initial_cruise_distance: float = 300
 
-        self.plane_pitching_up: bool = False
-
         self.event_handler: EventHandler = init_data.get("event_handler", DefaultEventHandler)(
             set_plane_is_pitching_up=self.set_plane_is_pitching_up
         )
 
+        self.reset(course_table=self.course_table)
+
+    @classmethod
+    def preloaded(cls, **init_data) -> Game:
+        """
+        Return a new Game whose Background is already loaded, such that its first frame is rendered without loading it, as when the Game is prepared by the scene_manager ahead of its Scene.
+        :param init_data: As for `Game`.
+        :return:
+        """
+        game = cls(**init_data)
+        game.prepare_background()
+        return game
+
+    def reset(self, seed: int | None = None, course_table: CourseTable | None = None) -> None:
+        """
+        Restore the Game to its initial state in place, reusing its World, Surfaces, Systems and Font.
+        The CrateWalls that have been spawned are despawned, so that they can be recycled by the next flight.
+        :param seed: The seed of a new course of CrateWalls. If both `seed` and `course_table` are None, a new course is seeded from an operating system source of randomness.
+        :param course_table: A course of CrateWalls to fly, such as a shared, pregenerated course. If supplied, `seed` is ignored.
+        """
+        if course_table is not None:
+            self.course_table = course_table
+        elif seed is None or seed != self.course_table.seed:
+            self.course_table = CourseTable(seed)
+        self.crate_walls_spawned = 0
+
+        self.camera.position = Vector2(0, 0)
+        for pilot in self.pilots:
+            pilot.plane.position = Vector2(0, 0)
+            pilot.plane.rotation = 0
+            pilot.plane.previous_position = Vector2(pilot.plane.position)
+            pilot.plane.previous_rotation = pilot.plane.rotation
+            pilot.plane.linear_velocity = Vector2(10, 0)
+            pilot.plane.angular_velocity = 0
+            pilot.score = 0
+            pilot.is_pitching_up = False
+            pilot.has_crashed = False
+
+        self.world.despawn(*self.course.clear())
+
+        self.distance_for_next_wall = 0
+        self.score_surface = self.initial_score_surface
+        self.scene_state = self.initial_cruise
+        self.next_scene = self
+
+    @property
+    def score(self) -> int:
+        """
+        The highest score of any of the Game's planes.
+        """
+        return max(pilot.score for pilot in self.pilots)
+
+    @property
+    def lead_pilot(self) -> Pilot:
+        """
+        The furthest of the Pilots whose planes haven't crashed, or the first Pilot if every plane has crashed.
+        """
+        return max((pilot for pilot in self.pilots if not pilot.has_crashed), key=lambda pilot: pilot.plane.position.x, default=self.pilots[0])
+
+    def enable_profiling(self) -> None:
+        """
+        Begin recording the call counts, Entity tuple counts, and wall times of each of the Game's Systems.
+        """
+        for system in self.systems.values():
+            system.enable_profiling()
+
+    def disable_profiling(self) -> None:
+        for system in self.systems.values():
+            system.disable_profiling()
+
+    def system_profiles(self) -> dict[str, dict[str, Any]]:
+        """
+        Return the statistics recorded for each of the Game's profiled Systems, keyed by the name of the System.
+        """
+        return {name: system.profile.as_dict() for name, system in self.systems.items() if system.profile is not None}
+
     def end_game(self) -> None:
+        # Imported on demand, so that importing the Game doesn't also import the GameOver Scene and the scene_manager before any Game has ended.
+        import src.scene.game_over as game_over
         self.set_next_scene(
-            game_over.GameOver(
-                score=self.score,
-                screenshot=self.camera.surface
-            )
+            game_over.GameOver(score=self.score)
         )
 
-    def set_plane_is_pitching_up(self, is_pitching_up: bool):
-        self.plane_pitching_up = is_pitching_up
+    def unspawned_crate_walls(self, count: int) -> list[tuple[float, int]]:
+        """
+        Return the position and the gap location of each of the next `count` CrateWalls that have yet to be spawned, read ahead from the course.
+        A CrateWall is spawned a window's width ahead of the camera once the lead plane passes `distance_for_next_wall`, so its position is an estimate, which is off by no more than the distance the lead plane flies in a step.
+        :param count:
+        :return:
+        """
+        position: float = max(self.distance_for_next_wall, self.initial_cruise_distance) + self.window_size.x
+        crate_walls: list[tuple[float, int]] = []
+        for index in range(self.crate_walls_spawned, self.crate_walls_spawned + count):
+            spacing, metal_frame_location = self.course_table[index]
+            crate_walls.append((position, metal_frame_location))
+            position += spacing
+        return crate_walls
+
+    def set_plane_is_pitching_up(self, is_pitching_up: bool, plane_index: int = 0):
+        self.pilots[plane_index].is_pitching_up = is_pitching_up
 
     def process_events(self, events: list[Event]) -> None:
         for event in events:
@@ -106,62 +240,122 @@ class Game(Scene):
 
     def initial_cruise(self) -> None:
         self.camera.position = self.plane.position.project(Vector2(1, 0))
-        self.move_system(self.world.query())
-        self.background.position = self.camera.position - self.camera.anchor
+        self.motion_schedule(self.world.query())
         if self.plane.position.x > self.initial_cruise_distance:
             self.distance_for_next_wall = self.plane.position.x
             self.scene_state = self.acrobatic_flight
 
     def acrobatic_flight(self) -> None:
+        flying_pilots: list[Pilot] = [pilot for pilot in self.pilots if not pilot.has_crashed]
+
+        for pilot in flying_pilots:
+            self.steer(pilot)
+
+        lead_plane: Plane = self.lead_pilot.plane
+        if lead_plane.position.x > self.distance_for_next_wall:
+            spacing, metal_frame_location = self.course_table[self.crate_walls_spawned]
+            self.crate_walls_spawned += 1
+            self.distance_for_next_wall += spacing
+            self.course.append(self.world.spawn(
+                CrateWall,
+                position=self.camera.position.x + self.window_size.x,
+                render_height=1,
+                metal_frame_location=metal_frame_location
+            ))
+
+        self.camera.position = lead_plane.position.project(Vector2(1, 0))
+        self.motion_schedule(self.world.query())
+
+        score: int = self.score
+        for pilot in flying_pilots:
+            # The pilot's score is also the index, within the whole course, of the next CrateWall that the pilot is to pass.
+            next_crate_walls = self.course.upcoming(1, start=pilot.score - self.course.first_index)
+            if next_crate_walls and next_crate_walls[0].position.x < pilot.plane.previous_position.x - next_crate_walls[0].width:
+                pilot.plane.linear_velocity += Vector2(0.1, 0).rotate(pilot.plane.rotation)
+                pilot.score += 1
+
+        if self.score != score:
+            self.score_surface = self.score_font.render(str(self.score), True, self.score_font_color)
+
+        # CrateWalls are despawned once every plane that is still flying has passed them.
+        while len(self.course) > 0 and all(pilot.score > self.course.first_index for pilot in flying_pilots):
+            self.world.despawn(self.course.popleft())
+
+        for pilot in flying_pilots:
+            if self.has_collided(pilot.plane):
+                pilot.has_crashed = True
+
+        for pilot in flying_pilots:
+            if pilot.has_crashed:
+                # The wreckage is left where it crashed.
+                pilot.plane.linear_velocity = Vector2(0, 0)
+                pilot.plane.angular_velocity = 0
+
+        if all(pilot.has_crashed for pilot in self.pilots):
+            self.end_game()
+
+    def steer(self, pilot: Pilot) -> None:
+        """
+        Update the velocities of a Pilot's plane from whether the Pilot is pitching up, and bounce the plane off of the ceiling or crash it into the floor.
+        :param pilot:
+        """
+        plane: Plane = pilot.plane
         plane_max_abs_angle: float = 75.0
         # Remap the angle values such that [0, 180) -> [0, 180) and [180, 360) -> [-180, 0)
-        plane_rotation: float = (self.plane.rotation + 180) % 360 - 180
-        if self.plane_pitching_up:
+        plane_rotation: float = (plane.rotation + 180) % 360 - 180
+        if pilot.is_pitching_up:
             if plane_rotation < -plane_max_abs_angle:
-                self.plane.angular_velocity = 0.5
+                plane.angular_velocity = 0.5
             else:
-                self.plane.angular_velocity = -2.5
+                plane.angular_velocity = -2.5
         else:
             if plane_rotation > plane_max_abs_angle:
-                self.plane.angular_velocity = -0.5
+                plane.angular_velocity = -0.5
             else:
-                self.plane.angular_velocity = 2.5
-
-        if self.plane.position.y < (-self.window_size.y + self.plane.surface.get_height()) / 2:
-            self.plane.position.y = (-self.window_size.y + self.plane.surface.get_height()) / 2
-            self.plane.linear_velocity.y *= -1
-        elif self.plane.position.y > (self.window_size.y - self.plane.surface.get_height()) / 2:
-            self.end_game()
-
-        self.plane.linear_velocity.rotate_ip(self.plane.angular_velocity)
-        self.plane.rotation = math.degrees(math.atan2(*self.plane.linear_velocity.yx))
-
-        if self.plane.position.x > self.distance_for_next_wall:
-            self.distance_for_next_wall += random.randint(*(self.window_size.elementwise() * Vector2(0.5, 1)))
-            self.world.add(CrateWall(position=self.camera.position.x + self.window_size.x, render_height=1))
-
-        self.camera.position = self.plane.position.project(Vector2(1, 0))
-        self.move_system(self.world.query())
-        self.background.position = self.camera.position - self.camera.anchor
-
-        passed_wall = next(self.world.query(lambda entity: isinstance(entity, CrateWall) and entity.position.x < self.camera.position.x - entity.surface.get_width()), None)
-        if passed_wall:
-            self.plane.linear_velocity += Vector2(0.1, 0).rotate(self.plane.rotation)
-            self.score += 1
-            self.score_surface = self.score_font.render(str(self.score), True, self.score_font_color)
-            self.world.remove(passed_wall)
-
-        for e0, e1, polygon_pairs in self.collision_detection_system(self.world.query()):
+                plane.angular_velocity = 2.5
+
+        if plane.position.y < (-self.window_size.y + plane.surface.get_height()) / 2:
+            plane.position.y = (-self.window_size.y + plane.surface.get_height()) / 2
+            plane.linear_velocity.y *= -1
+        elif plane.position.y > (self.window_size.y - plane.surface.get_height()) / 2:
+            pilot.has_crashed = True
+
+        plane.linear_velocity.rotate_ip(plane.angular_velocity)
+        plane.rotation = math.degrees(math.atan2(*plane.linear_velocity.yx))
+
+    def has_collided(self, plane: Plane) -> bool:
+        """
+        Return whether the plane collided with a CrateWall during its most recent movement.
+        :param plane:
+        """
+        collision_candidates = tuple(self.course.overlapping(
+            min(plane.previous_position.x, plane.position.x) - self.plane_collision_radius,
+            max(plane.previous_position.x, plane.position.x) + self.plane_collision_radius
+        ))
+        self.collision_checks += len(collision_candidates)
+        for e0, e1, polygon_pairs in self.collision_detection_system((plane, *collision_candidates)):
             if len(polygon_pairs) > 0 and all(any(isinstance(entity, entity_type) for entity in (e0, e1)) for entity_type in (Plane, CrateWall)):
-                self.end_game()
+                return True
+        return False
 
     def step(self) -> None:
         self.scene_state()
 
+    def prepare_background(self) -> Background:
+        """
+        Load the Background, if it hasn't been loaded yet, and move it to follow the camera.
+        :return:
+        """
+        if self.background is None:
+            self.background = Background(render_height=-1)
+            self.world.add(self.background)
+        self.background.position = self.camera.position - self.camera.anchor
+        return self.background
+
     def render(self, screen: Surface) -> None:
 
-        self.parallax_system(self.world.query())
-        self.render_system(self.world.query())
+        self.prepare_background()
+        self.render_schedule(self.world.query())
 
         screen.blit(self.camera.surface, dest=(0, 0))
         screen.blit(self.score_surface, dest=(screen.get_width() / 2, 10))
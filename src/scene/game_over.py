@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from time import monotonic
+
 import pygame as pg
-from pygame import Color, Vector2
+from pygame import Vector2
 from pygame.event import Event
 from pygame.font import Font
 from pygame.surface import Surface, SurfaceType
 
 import src.scene.game as game
+import src.scene.scene_manager as scene_manager
 from src.scene.scene import Scene
 
 
@@ -14,31 +17,35 @@ class GameOver(Scene):
     def __init__(self, **init_data):
         super().__init__(**init_data)
 
-        self.background: Surface = init_data.get("screenshot").copy()
-        lighten = Surface(self.background.get_size())
-        pg.draw.rect(lighten, Color(255, 255, 255, 127), lighten.get_rect())
-        self.background.blit(lighten, (0, 0))
+        self.background_color = "white"
 
+        # The Fonts are loaded by each GameOver rather than shared, as a shared Font would outlive pg.quit, which frees it.
         self.final_score_display = Font("freesansbold.ttf", 64).render(f"Score: {init_data.get('score')}", True, "black")
 
         self.replay_text = Font("freesansbold.ttf", 32).render("click to fly again", True, "black")
+        self.has_prepared_game: bool = False
 
-        self.scene_begin_time = pg.time.get_ticks()
+        # PyGame's ticks are only counted once every subsystem has been initialized with pg.init, which the game doesn't call.
+        self.scene_begin_time: float = monotonic()
         self.click_disable_duration = 1000
 
     def process_events(self, events: list[Event]) -> None:
         for event in events:
             if event.type == pg.QUIT:
                 self.next_scene = None
-            elif event.type == pg.MOUSEBUTTONDOWN and event.button == 1 and pg.time.get_ticks() - self.scene_begin_time > self.click_disable_duration:
-                self.set_next_scene(game.Game())
+            elif event.type == pg.MOUSEBUTTONDOWN and event.button == 1 and (monotonic() - self.scene_begin_time) * 1000 > self.click_disable_duration:
+                self.set_next_scene(scene_manager.take_prepared() or game.Game.preloaded())
 
     def step(self) -> None:
-        pass
+        # The next Game is prepared while the GameOver idles, rather than on the frame of the click.
+        # A GameOver that's never stepped, such as one ending an episode of a FlightSchool, never prepares one.
+        if not self.has_prepared_game:
+            scene_manager.prepare(game.Game.preloaded)
+            self.has_prepared_game = True
 
     def render(self, screen: Surface | SurfaceType) -> None:
 
-        screen.blit(self.background, (0, 0))
+        screen.fill(self.background_color, screen.get_rect())
 
         screen.blit(
             self.final_score_display,
@@ -4,7 +4,8 @@
 from __future__ import annotations
 
 import sys
-from typing import List
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List
 
 from pygame import Surface, SurfaceType
 from pygame.event import Event
@@ -15,6 +16,10 @@ _this = sys.modules[__name__]
 
 current_scene: Scene | None = None
 
+# The Scene that's likely to be transitioned into next, which is constructed on a background thread by prepare.
+prepared_scene: Future[Scene] | None = None
+_scene_preparer: ThreadPoolExecutor | None = None
+
 
 def render(screen: Surface | SurfaceType) -> None:
     _this.current_scene.render(screen)
@@ -30,3 +35,21 @@ def step() -> None:
 
 def set_scene(scene: Scene | None) -> None:
     _this.current_scene = scene
+
+
+def prepare(scene_factory: Callable[[], Scene]) -> None:
+    """
+    Begin constructing, on a background thread, the Scene that's likely to be transitioned into next, such that the transition needn't wait on loading its resources. A previously prepared Scene that hasn't been taken is discarded.
+    :param scene_factory: A callable that constructs and returns the Scene.
+    """
+    if _this._scene_preparer is None:
+        _this._scene_preparer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="scene_preparer")
+    _this.prepared_scene = _this._scene_preparer.submit(scene_factory)
+
+
+def take_prepared() -> Scene | None:
+    """
+    Return the prepared Scene, waiting for its construction to finish if it hasn't yet, or None if no Scene has been prepared. A prepared Scene can only be taken once.
+    """
+    prepared_scene, _this.prepared_scene = _this.prepared_scene, None
+    return None if prepared_scene is None else prepared_scene.result()
@@ -7,7 +7,7 @@ from pygame import Surface, SurfaceType, Vector2
 from pygame.event import Event
 from pygame.font import Font
 
-from src.scene.game import Game
+import src.scene.scene_manager as scene_manager
 from src.scene.scene import Scene
 
 
@@ -19,16 +19,20 @@ class Splash(Scene):
         self.background_color = "white"
         self.title_banner = Font("freesansbold.ttf", 128).render("Plain Paper Plane", True, "black")
         self.start_text = Font("freesansbold.ttf", 32).render("click to fly", True, "black")
+        self.has_prepared_game: bool = False
 
     def process_events(self, events: List[Event]) -> None:
         for event in events:
             if event.type == pg.QUIT:
                 self.set_next_scene(None)
             elif event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
-                self.set_next_scene(Game())
+                self.set_next_scene(scene_manager.take_prepared() or _preloaded_game())
 
     def step(self) -> None:
-        pass
+        # The Game is prepared while the Splash idles, rather than on the frame of the click.
+        if not self.has_prepared_game:
+            scene_manager.prepare(_preloaded_game)
+            self.has_prepared_game = True
 
     def render(self, screen: Surface | SurfaceType) -> None:
 
@@ -41,3 +45,9 @@ class Splash(Scene):
             self.start_text,
             self.start_text.get_rect(center=Vector2(screen.get_rect().center) + Vector2(0, 75))
         )
+
+
+def _preloaded_game() -> Scene:
+    # Imported on demand so that the Splash is shown without waiting on the import of the Game and its World.
+    from src.scene.game import Game
+    return Game.preloaded()
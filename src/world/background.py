@@ -1,3 +1,5 @@
+from __future__ import annotations
+
 from pygame import Surface, Vector2
 from pygame.image import load
 
@@ -6,6 +8,11 @@ from src.world.component import TileWrapTexture, Transform
 
 
 class Background(Entity, TileWrapTexture, Transform):
+
+    # Neither the image nor its tiling is ever drawn upon, so they're loaded and built once, on the construction of the first Background, and shared by every Background.
+    _image: Surface | None = None
+    _expanded_surface: Surface | None = None
+
     def __init__(
         self,
         *,
@@ -13,13 +20,19 @@ class Background(Entity, TileWrapTexture, Transform):
         render_height: int = 0,
         **kwargs
     ):
-        image: Surface = load("res/game_background.png")
+        if Background._image is None:
+            Background._image = load("res/game_background.png")
+
         super().__init__(
-            surface=image,
-            subsurface_size=image.get_size(),
-            anchor=Vector2(image.get_size()) * -0.5,
+            surface=self._image,
+            subsurface_size=self._image.get_size(),
+            expanded_surface=self._expanded_surface,
+            anchor=Vector2(self._image.get_size()) * -0.5,
             position=position,
             render_height=render_height,
             rotation=0,
             **kwargs
         )
+
+        if Background._expanded_surface is None:
+            Background._expanded_surface = self.expanded_surface
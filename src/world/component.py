@@ -1,6 +1,6 @@
 from typing import Iterable
 
-from pygame import Surface, Vector2
+from pygame import Rect, Surface, Vector2
 
 from src.ecs.ecs import Component
 from src.geometry.polygon import Polygon
@@ -13,6 +13,8 @@ class Transform(Component):
     :param rotation: The angular orientation of the entity in the world.
     """
 
+    _fields = ("position", "rotation")
+
     def __init__(self, *, position: Vector2, rotation: float = 0, **kwargs):
         super().__init__(**kwargs)
         self.position: Vector2 = position
@@ -20,6 +22,9 @@ class Transform(Component):
 
 
 class Velocity(Transform):
+
+    _fields = ("linear_velocity", "angular_velocity", "previous_position", "previous_rotation")
+
     def __init__(self, *, linear_velocity: Vector2 = Vector2(0, 0), angular_velocity: float = 0, **kwargs):
         """
         A mixin class for adding motion to Entity classes.
@@ -32,9 +37,15 @@ class Velocity(Transform):
         super().__init__(**kwargs)
         self.linear_velocity: Vector2 = linear_velocity
         self.angular_velocity: float = angular_velocity
+        # The transform from before the most recent movement, used to detect collisions along the path of the movement.
+        self.previous_position: Vector2 = Vector2(self.position)
+        self.previous_rotation: float = self.rotation
 
 
 class PolygonCollider(Transform):
+
+    _fields = ("polygons",)
+
     def __init__(self, *, polygons: Iterable[Polygon], **kwargs):
         """
         A Mixin class for adding collision detection regions by way of Polygons.
@@ -42,10 +53,13 @@ class PolygonCollider(Transform):
         :param polygons: An iterable of Polygons. *Note:* Each Polygon must be a convex polygon whose vertices are measured from the anchor point of the Entity.
         """
         super().__init__(**kwargs)
-        self.polygons: set[Polygon] = set(polygons)
+        self.polygons: tuple[Polygon, ...] = tuple(polygons)
 
 
 class Texture(Component):
+
+    _fields = ("surface", "anchor", "render_height")
+
     def __init__(self, *, surface: Surface, anchor: Vector2 = Vector2(0, 0), render_height=0, **kwargs):
         """
         A mixin class for adding visual representation to Entity-Type classes.
@@ -59,12 +73,65 @@ class Texture(Component):
         self.render_height: int = render_height
 
 
+class AtlasTexture(Component):
+
+    _fields = ("atlas", "size", "regions", "anchor", "render_height")
+
+    def __init__(
+        self,
+        *,
+        atlas: Surface,
+        size: tuple[int, int],
+        regions: tuple[tuple[Rect, tuple[int, int]], ...],
+        anchor: Vector2 = Vector2(0, 0),
+        render_height=0,
+        **kwargs
+    ):
+        """
+        A mixin class for adding visual representation, assembled from regions of a shared texture atlas rather than held as a Surface of its own, to Entity-Type classes that are never rotated.
+        :param atlas: The Surface of the texture atlas.
+        :param size: The size of the bounding box of the regions, whose center is the position of the Entity, less the anchor.
+        :param regions: Pairs of a region of the atlas and the (x, y) offset, from the top left corner of the bounding box, at which the region is drawn.
+        :param anchor: The Vector2 location, relative to the center of the bounding box, at which the Entity is positioned.
+        :param kwargs: Used by Component Type mixin classes for multiple inheritance.
+        """
+        super().__init__(**kwargs)
+        self.atlas: Surface = atlas
+        self.size: tuple[int, int] = size
+        self.regions: tuple[tuple[Rect, tuple[int, int]], ...] = regions
+        self.anchor: Vector2 = anchor
+        self.render_height: int = render_height
+
+
 class TileWrapTexture(Texture):
-    def __init__(self, *, subsurface_size: tuple[int, int], is_horizontally_wrapped: bool = False, is_vertically_wrapped: bool = False, **kwargs):
+
+    _fields = ("subsurface_size", "base_image_size", "expanded_surface")
+
+    def __init__(
+        self,
+        *,
+        subsurface_size: tuple[int, int],
+        is_horizontally_wrapped: bool = False,
+        is_vertically_wrapped: bool = False,
+        expanded_surface: Surface | None = None,
+        **kwargs
+    ):
+        """
+        :param subsurface_size:
+        :param is_horizontally_wrapped:
+        :param is_vertically_wrapped:
+        :param expanded_surface: Optionally, the tiled Surface previously built for the same `surface`, `subsurface_size`, and wrapping, such as one shared by every instance of a type, which is reused rather than built again.
+        :param kwargs: Used by Component Type mixin classes for multiple inheritance.
+        """
         super().__init__(**kwargs)
         self.subsurface_size: tuple[int, int] = subsurface_size
         self.base_image_size: tuple[int, int] = self.surface.get_size()
 
+        if expanded_surface is not None:
+            self.expanded_surface: Surface = expanded_surface
+            self.surface = self.expanded_surface.subsurface(0, 0, *subsurface_size)
+            return
+
         tile_width: int
         tile_height: int
         tile_width, tile_height = self.base_image_size
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from collections import deque
+from itertools import islice
+from typing import Iterator
+
+from src.world.crate_wall import CrateWall
+
+
+class Course:
+    """
+    The CrateWalls of an obstacle course, ordered by their horizontal positions.
+    CrateWalls are spawned ahead of the plane and passed behind it strictly in order of position, so they're appended to the back and removed from the front of a deque.
+    """
+
+    def __init__(self):
+        self._crate_walls: deque[CrateWall] = deque()
+        # The index, within the whole course, of the first CrateWall of the deque.
+        self.first_index: int = 0
+
+    def __len__(self) -> int:
+        return len(self._crate_walls)
+
+    def __iter__(self) -> Iterator[CrateWall]:
+        return iter(self._crate_walls)
+
+    def append(self, crate_wall: CrateWall) -> None:
+        """
+        Add a CrateWall to the end of the Course.
+        :param crate_wall: A CrateWall positioned no further back than the last CrateWall of the Course.
+        """
+        assert not self._crate_walls or self._crate_walls[-1].position.x <= crate_wall.position.x, "CrateWalls must be appended in order of position."
+        self._crate_walls.append(crate_wall)
+
+    def popleft(self) -> CrateWall:
+        """
+        Remove and return the first CrateWall of the Course.
+        :return:
+        """
+        self.first_index += 1
+        return self._crate_walls.popleft()
+
+    def upcoming(self, count: int, start: int = 0) -> list[CrateWall]:
+        """
+        Return, at most, `count` CrateWalls of the Course, beginning with the CrateWall at index `start` of the deque.
+        :param count:
+        :param start:
+        :return:
+        """
+        return list(islice(self._crate_walls, start, start + count))
+
+    def overlapping(self, left: float, right: float) -> Iterator[CrateWall]:
+        """
+        Return an Iterator of the CrateWalls whose horizontal extents overlap the interval from `left` to `right`.
+        Only the CrateWalls from the front of the Course up to the first CrateWall beyond `right` are visited.
+        :param left:
+        :param right:
+        :return:
+        """
+        for crate_wall in self._crate_walls:
+            half_width = crate_wall.width / 2
+            if crate_wall.position.x - half_width > right:
+                return
+            if crate_wall.position.x + half_width >= left:
+                yield crate_wall
+
+    def clear(self) -> list[CrateWall]:
+        """
+        Remove every CrateWall from the Course.
+        :return: The removed CrateWalls.
+        """
+        crate_walls = list(self._crate_walls)
+        self._crate_walls.clear()
+        self.first_index = 0
+        return crate_walls
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+
+class CourseTable:
+    """
+    A seeded obstacle course, stored as compact NumPy arrays of the spacing between consecutive CrateWalls and the location of the gap in each CrateWall.
+    The course is generated lazily, in chunks, as it's read. Each chunk is generated from the seed and the index of the chunk alone, so any prefix of a course is identical no matter how, or by whom, it was generated.
+    A pregenerated course can be saved to a file and opened, memory-mapped and read-only, by any number of processes, which then replay the same course without generating it. Reading beyond the end of an opened course generates the remainder privately.
+    """
+
+    # The first record of a saved course holds its seed, in place of a spacing.
+    record_dtype: np.dtype = np.dtype([("spacing", "<u4"), ("metal_frame_location", "u1")])
+    chunk_size: int = 256
+    # Consecutive CrateWalls are spaced between half of the Game's window width and its window height apart.
+    minimum_spacing: int = 640
+    maximum_spacing: int = 720
+    metal_frame_location_range: tuple[int, int] = (1, 5)
+
+    def __init__(self, seed: int | None = None):
+        """
+        :param seed: An unsigned 32 bit integer from which the course is generated. If None, a seed is drawn from an operating system source of randomness.
+        """
+        self.seed: int = int(np.random.SeedSequence().entropy % 2 ** 32) if seed is None else seed
+        self._records: np.ndarray = np.empty(0, dtype=self.record_dtype)
+
+    def __len__(self) -> int:
+        """
+        Return the number of CrateWalls that have been generated so far.
+        """
+        return len(self._records)
+
+    def __getitem__(self, index: int) -> tuple[int, int]:
+        """
+        Return the spacing before, and the gap location of, the CrateWall at the specified index of the course, generating the course up to the index if needed.
+        :param index:
+        :return:
+        """
+        if index >= len(self._records):
+            self.extend(index + 1)
+        record = self._records[index]
+        return int(record["spacing"]), int(record["metal_frame_location"])
+
+    @property
+    def spacings(self) -> np.ndarray:
+        return self._records["spacing"]
+
+    @property
+    def metal_frame_locations(self) -> np.ndarray:
+        return self._records["metal_frame_location"]
+
+    def extend(self, length: int) -> None:
+        """
+        Generate whole chunks of the course until it has at least `length` CrateWalls.
+        :param length:
+        """
+        generated_length: int = len(self._records)
+        if length <= generated_length:
+            return
+
+        chunks: list[np.ndarray] = [self._records]
+        for chunk_index in range(generated_length // self.chunk_size, -(-length // self.chunk_size)):
+            chunk = self._generate_chunk(chunk_index)
+            # A course opened from a file may end partway through a chunk.
+            chunks.append(chunk[max(generated_length - chunk_index * self.chunk_size, 0):])
+
+        # Concatenation copies, so a read-only memory-mapped course is never written to.
+        self._records = np.concatenate(chunks)
+
+    def _generate_chunk(self, chunk_index: int) -> np.ndarray:
+        generator = np.random.default_rng((self.seed, chunk_index))
+        chunk = np.empty(self.chunk_size, dtype=self.record_dtype)
+        chunk["spacing"] = generator.integers(self.minimum_spacing, self.maximum_spacing, size=self.chunk_size, endpoint=True)
+        chunk["metal_frame_location"] = generator.integers(*self.metal_frame_location_range, size=self.chunk_size, endpoint=True)
+        return chunk
+
+    def save(self, path: str | os.PathLike, length: int) -> None:
+        """
+        Write the first `length` CrateWalls of the course to a `.npy` file that can be opened by `CourseTable.open`.
+        :param path:
+        :param length:
+        """
+        self.extend(length)
+        records = np.empty(length + 1, dtype=self.record_dtype)
+        records[0] = (self.seed, 0)
+        records[1:] = self._records[:length]
+        np.save(path, records, allow_pickle=False)
+
+    @classmethod
+    def open(cls, path: str | os.PathLike) -> CourseTable:
+        """
+        Open a course saved by `CourseTable.save`, memory-mapped and read-only, such that the pages of the file are shared by every process that opens it.
+        :param path:
+        :return:
+        """
+        records: np.ndarray = np.load(path, mmap_mode="r", allow_pickle=False)
+        assert records.dtype == cls.record_dtype, f"{path} does not hold a CourseTable."
+
+        course_table = cls(seed=int(records[0]["spacing"]))
+        course_table._records = records[1:]
+        return course_table
@@ -1,59 +1,102 @@
+from __future__ import annotations
+
 import random
 
-from pygame import SRCALPHA, Surface, Vector2
-from pygame.image import load
+from pygame import Rect, Vector2
 
 from src.ecs.ecs import Entity
 from src.geometry.polygon import Polygon
-from src.world.component import PolygonCollider, Texture
+from src.world.component import AtlasTexture, PolygonCollider
+from src.world.texture_atlas import TextureAtlas
+
+
+class CrateWall(Entity, AtlasTexture, PolygonCollider):
 
+    _fields = ("metal_frame_location", "_polygon_top", "_polygon_bottom")
 
-class CrateWall(Entity, Texture, PolygonCollider):
+    crate_count: int = 7
+
+    # The atlas regions of a CrateWall depend only on its metal_frame_location, so each tuple of them is built once and shared.
+    _regions_by_metal_frame_location: dict[int, tuple[tuple[Rect, tuple[int, int]], ...]] = {}
 
     def __init__(
         self,
         *,
         position: float,
         render_height: int = 0,
+        metal_frame_location: int | None = None,
         **kwargs
     ):
-        crate = load("res/crate.png")
-        metal_frame = load("res/metal_frame.png")
-        wall = Surface((crate.get_width(), crate.get_height() * 7), flags=SRCALPHA)
-        wall.fill((0, 0, 0, 0))
-
-        crate_height = crate.get_height()
-        metal_frame_location = random.randint(1, 5)
-        blit_surfaces = [crate if n != metal_frame_location else metal_frame for n in range(7)]
-        blit_locations = [(0, crate_height * n) for n in range(7)]
-        crate_blits = list(zip(blit_surfaces, blit_locations))
-        wall.blits(crate_blits)
-
-        crate_width_half: float = crate.get_width() / 2
-        wall_height_half: float = wall.get_height() / 2
-
-        polygon_top = Polygon(
-            Vector2(-crate_width_half, -wall_height_half),
-            Vector2(-crate_width_half, -wall_height_half + crate_height * metal_frame_location),
-            Vector2(crate_width_half, -wall_height_half + crate_height * metal_frame_location),
-            Vector2(crate_width_half, -wall_height_half)
-        )
+        """
+        :param position: The horizontal position of the CrateWall.
+        :param render_height:
+        :param metal_frame_location: The index, from 1 to 5, of the crate replaced by the metal frame through which the plane flies. If None, it's chosen at random.
+        """
+        atlas: TextureAtlas = TextureAtlas.get()
+        crate: Rect = atlas.regions["crate"]
 
-        polygon_bottom = Polygon(
-            Vector2(-crate_width_half, -wall_height_half + crate_height * (metal_frame_location + 1)),
-            Vector2(-crate_width_half, wall_height_half),
-            Vector2(crate_width_half, wall_height_half),
-            Vector2(crate_width_half, -wall_height_half + crate_height * (metal_frame_location + 1))
-        )
-
-        self.metal_frame_location = metal_frame_location
+        # The vertices are placed by _set_metal_frame_location.
+        self._polygon_top: Polygon = Polygon(*((0, 0) for _ in range(4)))
+        self._polygon_bottom: Polygon = Polygon(*((0, 0) for _ in range(4)))
 
         super().__init__(
-            surface=wall,
+            atlas=atlas.surface,
+            size=(crate.width, crate.height * self.crate_count),
+            # The regions are placed by _set_metal_frame_location.
+            regions=(),
             anchor=Vector2(0, 0),
             position=Vector2(position, 0),
             render_height=render_height,
             rotation=0,
-            polygons=[polygon_top, polygon_bottom],
+            polygons=[self._polygon_top, self._polygon_bottom],
             **kwargs
         )
+
+        self._set_metal_frame_location(random.randint(1, 5) if metal_frame_location is None else metal_frame_location)
+
+    @property
+    def width(self) -> int:
+        return self.size[0]
+
+    def respawn(self, *, position: float, render_height: int = 0, metal_frame_location: int | None = None, **kwargs) -> None:
+        """
+        Move this despawned CrateWall to the specified position with a newly placed gap, reusing its Polygons.
+        :param position:
+        :param render_height:
+        :param metal_frame_location:
+        """
+        self.position.update(position, 0)
+        self.render_height = render_height
+        self._set_metal_frame_location(random.randint(1, 5) if metal_frame_location is None else metal_frame_location)
+
+    def _set_metal_frame_location(self, metal_frame_location: int) -> None:
+        self.metal_frame_location: int = metal_frame_location
+
+        crate_width, wall_height = self.size
+        crate_height: int = wall_height // self.crate_count
+        self.regions = self._regions_by_metal_frame_location.get(metal_frame_location)
+        if self.regions is None:
+            regions: dict[str, Rect] = TextureAtlas.get().regions
+            self.regions = self._regions_by_metal_frame_location[metal_frame_location] = tuple(
+                (regions["crate"] if n != metal_frame_location else regions["metal_frame"], (0, crate_height * n))
+                for n in range(self.crate_count)
+            )
+
+        crate_width_half: float = crate_width / 2
+        wall_height_half: float = wall_height / 2
+
+        top_vertices = (
+            (-crate_width_half, -wall_height_half),
+            (-crate_width_half, -wall_height_half + crate_height * metal_frame_location),
+            (crate_width_half, -wall_height_half + crate_height * metal_frame_location),
+            (crate_width_half, -wall_height_half)
+        )
+        bottom_vertices = (
+            (-crate_width_half, -wall_height_half + crate_height * (metal_frame_location + 1)),
+            (-crate_width_half, wall_height_half),
+            (crate_width_half, wall_height_half),
+            (crate_width_half, -wall_height_half + crate_height * (metal_frame_location + 1))
+        )
+
+        self._polygon_top.set_vertices(*top_vertices)
+        self._polygon_bottom.set_vertices(*bottom_vertices)
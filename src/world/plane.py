@@ -1,12 +1,19 @@
-from pygame import Vector2
-from pygame.image import load
+from __future__ import annotations
+
+from pygame import Surface, Vector2
 
 from src.ecs.ecs import Entity
 from src.geometry.polygon import Polygon
 from src.world.component import PolygonCollider, Texture, Velocity
+from src.world.texture_atlas import TextureAtlas
 
 
 class Plane(Entity, Texture, Velocity, PolygonCollider):
+
+    # Neither the image nor the collision Polygon of a Plane is ever modified, so they're shared by every Plane.
+    _image: Surface | None = None
+    _polygons: tuple[Polygon, ...] = (Polygon(Vector2(30, 0), Vector2(-26, -6), Vector2(-30, 6)),)
+
     def __init__(
         self,
         *,
@@ -17,14 +24,17 @@ class Plane(Entity, Texture, Velocity, PolygonCollider):
         angular_velocity: float = 0,
         **kwargs
     ):
+        if Plane._image is None:
+            Plane._image = TextureAtlas.get().subsurface("plane")
+
         super().__init__(
-            surface=load("res/plane.png"),
+            surface=self._image,
             anchor=Vector2(0, 0),
             render_height=render_height,
             position=position,
             rotation=rotation,
             linear_velocity=linear_velocity,
             angular_velocity=angular_velocity,
-            polygons=[Polygon(Vector2(30, 0), Vector2(-26, -6), Vector2(-30, 6))],
+            polygons=self._polygons,
             **kwargs
         )
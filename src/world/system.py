@@ -2,44 +2,55 @@ from __future__ import annotations
 
 from typing import Iterable
 
-from pygame import Color, Rect, Surface, Vector2
+from pygame import Color, Rect, Vector2
 from pygame.draw import polygon as draw_polygon
 from pygame.transform import rotate
 
 from src.ecs.ecs import Entity, System
 from src.geometry.polygon import Polygon
 from src.world.camera import Camera
-from src.world.component import PolygonCollider, Texture, TileWrapTexture, Transform, Velocity
+from src.world.component import AtlasTexture, PolygonCollider, Texture, TileWrapTexture, Transform, Velocity
 
 
 class Render(System):
     """
-    A System that renders the supplied Iterable of Entities to a specified Camera.
-    To be rendered, an Entitiy must have the Texture and Transform mixins.
+    A System that renders the supplied Iterable of Entities to a specified Camera, with a single batched blits call.
+    To be rendered, an Entitiy must have the Transform mixin and either the Texture or AtlasTexture mixin.
     """
 
     def __init__(self, camera: Camera):
         self.camera: Camera = camera
         super().__init__(
             action=self._transform_entity_texture,
-            predicate=lambda entity: isinstance(entity, Texture) and isinstance(entity, Transform) and not isinstance(entity, Camera)
+            predicate=lambda entity: isinstance(entity, (Texture, AtlasTexture)) and isinstance(entity, Transform) and not isinstance(entity, Camera),
+            reads=(Texture, AtlasTexture, Transform),
+            # The Camera's Texture is drawn upon.
+            writes=(Texture,)
         )
 
-    def __call__(self, entities: Iterable[Entity], **kwargs) -> None:
-        render_tuples = super().__call__(entities, **kwargs)
-        list(render_tuples).sort(key=lambda triple: triple[0])
-        render_height, surfaces, rects = zip(*render_tuples)
-        blit_tuples = list(zip(surfaces, rects))
-        self.camera.surface.blits(blit_tuples)
+    def run(self, entities: Iterable[Entity], **kwargs) -> None:
+        # The sort is stable, so Entities of the same render height are drawn in the order that they're supplied.
+        render_tuples = sorted(super().run(entities, **kwargs), key=lambda pair: pair[0])
+        self.camera.surface.blits([blit for _, blits in render_tuples for blit in blits], doreturn=False)
 
     # The Type hinting for entity should be something like Intersection[Texture, Transform],
     # but Python doesn't yet have intersections for Type hinting.
-    def _transform_entity_texture(self, entity: Texture | Transform) -> (int, Surface, Rect):
+    def _transform_entity_texture(self, entity: Texture | AtlasTexture | Transform) -> tuple[int, tuple[tuple, ...]]:
+        """
+        Return the render height of the Entity, along with the blits that draw it.
+        """
+        if isinstance(entity, AtlasTexture):
+            rect = Rect((0, 0), entity.size)
+            rect.center = entity.position - entity.anchor - self.camera.position + self.camera.anchor
+            left, top = rect.topleft
+            return entity.render_height, tuple(
+                (entity.atlas, (left + offset_x, top + offset_y), region)
+                for region, (offset_x, offset_y) in entity.regions
+            )
 
-        # PyGame mixes rotation handedness between modules.
-        surface = rotate(entity.surface, -entity.rotation)
-        return (
-            entity.render_height,
+        # PyGame mixes rotation handedness between modules. An unrotated Surface is drawn as is, rather than copied.
+        surface = rotate(entity.surface, -entity.rotation) if entity.rotation % 360 else entity.surface
+        return entity.render_height, ((
             surface,
             surface.get_rect(
                 center=(
@@ -49,7 +60,7 @@ class Render(System):
                     + self.camera.anchor
                 )
             )
-        )
+        ),)
 
 
 class Move(System):
@@ -61,11 +72,16 @@ class Move(System):
     def __init__(self):
         super().__init__(
             action=self._update_entity_transform,
-            predicate=lambda entity: isinstance(entity, Velocity)
+            predicate=lambda entity: isinstance(entity, Velocity),
+            collects_results=False,
+            reads=(Velocity,),
+            writes=(Transform,)
         )
 
     @staticmethod
     def _update_entity_transform(entity: Velocity) -> None:
+        entity.previous_position.update(entity.position)
+        entity.previous_rotation = entity.rotation
         entity.rotation += entity.angular_velocity
         entity.position += entity.linear_velocity
 
@@ -82,7 +98,11 @@ class Parallax(System):
         self.parallax_factor: tuple[float, float] = parallax_factor
         super().__init__(
             action=self._position_subsurface,
-            predicate=lambda entity: isinstance(entity, TileWrapTexture)
+            predicate=lambda entity: isinstance(entity, TileWrapTexture),
+            collects_results=False,
+            # The Camera's Transform is read.
+            reads=(Transform,),
+            writes=(TileWrapTexture,)
         )
 
     def _position_subsurface(self, entity: TileWrapTexture) -> None:
@@ -116,7 +136,11 @@ class VisualizePolygons(System):
 
         super().__init__(
             action=self._draw_polygons,
-            predicate=lambda entity: isinstance(entity, PolygonCollider)
+            predicate=lambda entity: isinstance(entity, PolygonCollider),
+            collects_results=False,
+            reads=(PolygonCollider,),
+            # The Camera's Texture is drawn upon.
+            writes=(Texture,)
         )
 
     def _draw_polygons(self, entity: PolygonCollider) -> None:
@@ -139,31 +163,24 @@ class DetectCollisions(System):
     def __init__(self):
         super().__init__(
             action=self._check_entity_collision,
-            predicate=lambda entity: isinstance(entity, PolygonCollider)
+            predicate=lambda entity: isinstance(entity, PolygonCollider),
+            reads=(PolygonCollider,)
         )
 
-    def __call__(self, entities: Iterable[Entity], **kwargs) -> tuple[tuple[PolygonCollider, PolygonCollider, set], ...]:
-        return tuple(filter(lambda test: len(test[2]) > 0, super().__call__(entities, **kwargs)))
+    def run(self, entities: Iterable[Entity], **kwargs) -> tuple[tuple[PolygonCollider, PolygonCollider, set], ...]:
+        return tuple(filter(lambda test: len(test[2]) > 0, super().run(entities, **kwargs)))
 
     @staticmethod
     def _check_polygon_collision(polygon_0: Polygon, polygon_1: Polygon) -> bool:
 
         # Separating Axis Theorem
-        for normal in list(polygon_0.surface_normals()) + list(polygon_1.surface_normals()):
-            p0_projection = {vertex.dot(normal) for vertex in polygon_0.vertices}
-            p1_projection = {vertex.dot(normal) for vertex in polygon_1.vertices}
-
-            projection_bounds = [
-                (min(p0_projection), 0),
-                (max(p0_projection), 0),
-                (min(p1_projection), 1),
-                (max(p1_projection), 1)
-            ]
-
-            projection_bounds.sort(key=lambda x: x[0])
+        for polygon in (polygon_0, polygon_1):
+            for edge_x, edge_y in polygon.edges():
+                p0_min, p0_max = polygon_0.projection_bounds(-edge_y, edge_x)
+                p1_min, p1_max = polygon_1.projection_bounds(-edge_y, edge_x)
 
-            if projection_bounds[0][1] == projection_bounds[1][1]:
-                return False
+                if p0_max <= p1_min or p1_max < p0_min:
+                    return False
 
         return True
 
@@ -185,3 +202,44 @@ class DetectCollisions(System):
                     collision_pairs.add((e0_polygon, e1_polygon))
 
         return entity_0, entity_1, collision_pairs
+
+
+class DetectSweptCollisions(DetectCollisions):
+    """
+    A System which, like DetectCollisions, returns all pairs of unique Entities from the supplied Iterable of Entities that have at least one overlapping Polygon, but which tests the whole of each moving Entity's most recent movement rather than only where it came to rest.
+    Each Polygon of an Entity with the Velocity mixin is replaced by the convex hull of the Polygon at its previous and current transforms. For a translation, the hull is exactly the region swept by the Polygon, so no collision is missed at any speed; the rotation over a single movement is assumed to be small.
+    A single Separating Axis Theorem test of the hull is made per pair of Polygons, rather than one test per sub-step of the movement.
+    """
+
+    @staticmethod
+    def _world_polygon(entity: PolygonCollider, polygon: Polygon) -> Polygon:
+        world_polygon = polygon.rotate(entity.rotation) + entity.position
+        if isinstance(entity, Velocity):
+            return (polygon.rotate(entity.previous_rotation) + entity.previous_position).sweep_to(world_polygon)
+        return world_polygon
+
+    @staticmethod
+    def _check_polygon_collision(polygon_0: Polygon, polygon_1: Polygon) -> bool:
+
+        # The bounding boxes are compared first, as the box of an axis-aligned Polygon, such as a CrateWall's, is the Polygon itself.
+        p0_min_x, p0_min_y, p0_max_x, p0_max_y = polygon_0.bounds()
+        p1_min_x, p1_min_y, p1_max_x, p1_max_y = polygon_1.bounds()
+        if p0_max_x <= p1_min_x or p1_max_x < p0_min_x or p0_max_y <= p1_min_y or p1_max_y < p0_min_y:
+            return False
+
+        return DetectCollisions._check_polygon_collision(polygon_0, polygon_1)
+
+    @classmethod
+    def _check_entity_collision(cls, entity_0: PolygonCollider, entity_1: PolygonCollider) -> tuple[PolygonCollider, PolygonCollider, set]:
+        collision_pairs = set()
+
+        e0_polygon: Polygon
+        for e0_polygon in entity_0.polygons:
+            e0pw = cls._world_polygon(entity_0, e0_polygon)
+
+            e1_polygon: Polygon
+            for e1_polygon in entity_1.polygons:
+                if cls._check_polygon_collision(e0pw, cls._world_polygon(entity_1, e1_polygon)):
+                    collision_pairs.add((e0_polygon, e1_polygon))
+
+        return entity_0, entity_1, collision_pairs
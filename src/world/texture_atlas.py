@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import pygame as pg
+from pygame import SRCALPHA, Rect, Surface
+from pygame.image import load
+
+
+class TextureAtlas:
+    """
+    The small images from `res/` that are drawn many times per frame, packed side by side into a single Surface, along with the region of the Surface that holds each image.
+    Entities drawn from the atlas share its one Surface, rather than each holding its own Surface, and are drawn with blits of regions of it.
+    """
+
+    image_names: tuple[str, ...] = ("crate", "metal_frame", "plane")
+
+    # Loaded once, on the first call to TextureAtlas.get.
+    _atlas: TextureAtlas | None = None
+
+    def __init__(self, directory: str = "res"):
+        """
+        :param directory: The directory holding a `.png` file for each of the `image_names`.
+        """
+        images: dict[str, Surface] = {name: load(f"{directory}/{name}.png") for name in self.image_names}
+
+        self.surface: Surface = Surface(
+            (sum(image.get_width() for image in images.values()), max(image.get_height() for image in images.values())),
+            flags=SRCALPHA
+        )
+        self.regions: dict[str, Rect] = {}
+        left: int = 0
+        for name, image in images.items():
+            self.regions[name] = self.surface.blit(image, (left, 0))
+            left += image.get_width()
+
+        # Converting the atlas to the pixel format of the display speeds up every blit from it, but needs a display.
+        if pg.display.get_init() and pg.display.get_surface() is not None:
+            self.surface = self.surface.convert_alpha()
+
+    @classmethod
+    def get(cls) -> TextureAtlas:
+        """
+        Return the TextureAtlas shared by every Entity, building it if it hasn't been built yet.
+        :return:
+        """
+        if cls._atlas is None:
+            cls._atlas = cls()
+        return cls._atlas
+
+    def subsurface(self, name: str) -> Surface:
+        """
+        Return a Surface that references, rather than copies, the region of the atlas that holds the named image.
+        :param name: One of `image_names`.
+        :return:
+        """
+        return self.surface.subsurface(self.regions[name])
@@ -1,37 +1,82 @@
 from __future__ import annotations
 
-from typing import Callable, Iterable
+from typing import Callable, Iterable, TypeVar
 
 from src.ecs.ecs import Entity
 
+EntityType = TypeVar("EntityType", bound=Entity)
+
 
 class World:
     """
     And object used to keeping track of a collection of unique Entities.
+    Entity IDs are allocated per World, and the IDs of removed Entities are reused, so they stay bounded by the peak number of Entities in the World.
     """
     def __init__(self, *entities: Entity):
         self._entities: dict[int, Entity] = {}
+        self._next_id: int = 0
+        self._free_ids: list[int] = []
+        self._pools: dict[type[Entity], list[Entity]] = {}
         self.add(*entities)
 
     def add(self, *entities: Entity) -> None:
         """
-        Store references to the supplied Entities in the World.
+        Store references to the supplied Entities in the World, assigning each an ID.
 
         :param entities:
         :return:
         """
         for entity in entities:
+            if entity.id is not None and self._entities.get(entity.id) is entity:
+                continue
+
+            if self._free_ids:
+                entity._id = self._free_ids.pop()
+            else:
+                entity._id = self._next_id
+                self._next_id += 1
             self._entities[entity.id] = entity
 
     def remove(self, *entities: Entity) -> None:
         """
-        Remove references to the supplied Entities from the World.
+        Remove references to the supplied Entities from the World, releasing their IDs.
 
         :param entities:
         :return:
         """
         for entity in entities:
             del self._entities[entity.id]
+            self._free_ids.append(entity.id)
+            entity._id = None
+
+    def spawn(self, entity_type: type[EntityType], **kwargs) -> EntityType:
+        """
+        Add an Entity of the specified type to the World, recycling a despawned Entity of that type when one is available.
+
+        :param entity_type:
+        :param kwargs: The keyword arguments with which to construct or respawn the Entity.
+        :return: The spawned Entity.
+        """
+        pool: list[Entity] | None = self._pools.get(entity_type)
+        if pool:
+            entity = pool.pop()
+            entity.respawn(**kwargs)
+        else:
+            entity = entity_type(**kwargs)
+        self.add(entity)
+        return entity
+
+    def despawn(self, *entities: Entity) -> None:
+        """
+        Remove the supplied Entities from the World, keeping those whose types support respawning for recycling by `spawn`.
+
+        :param entities:
+        :return:
+        """
+        self.remove(*entities)
+        for entity in entities:
+            if type(entity).respawn is not Entity.respawn:
+                self._pools.setdefault(type(entity), []).append(entity)
 
     def get(self, *entity_ids:int) -> tuple[Entity, ...]:
         """